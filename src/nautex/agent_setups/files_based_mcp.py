@@ -58,11 +58,18 @@ class FilesBasedMCPAgentSetup(AgentSetupBase):
         
         # Use asyncio.to_thread to run the file operations in a separate thread
         if mcp_path is not None:
-            path_exists = await asyncio.to_thread(lambda: (self.cwd / mcp_path).exists())
-            if path_exists:
+            full_path = self.cwd / mcp_path
+
+            def _check() -> Optional[MCPConfigStatus]:
+                # Existence check and validation share a single thread hop
+                if not full_path.exists():
+                    return None
                 # Pass the current working directory for cwd validation
-                status = await asyncio.to_thread(validate_mcp_file, self.cwd / mcp_path, self.cwd)
-                return status, self.cwd / mcp_path
+                return validate_mcp_file(full_path, self.cwd)
+
+            status = await asyncio.to_thread(_check)
+            if status is not None:
+                return status, full_path
 
         # No MCP configuration file found
         logger.debug(f"No MCP configuration file found at {mcp_path}")
@@ -1,6 +1,6 @@
 """Nautex API module with client factory for production and test modes."""
 
-from .client import NautexAPIClient, NautexAPIError
+from .client import NautexAPIClient, NautexAPIError, NautexAPIUnavailableError
 from .test_client import NautexTestAPIClient
 
 
@@ -24,5 +24,6 @@ __all__ = [
     'NautexAPIClient',
     'NautexTestAPIClient', 
     'NautexAPIError',
+    'NautexAPIUnavailableError',
     'create_api_client'
 ]
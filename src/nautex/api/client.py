@@ -1,13 +1,20 @@
 """Nautex API Client for low-level HTTP communication."""
 
 import asyncio
+import functools
+import inspect
 import logging
+import random
 import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Optional, Dict, Any, List, Tuple, Callable
 import aiohttp
 import json
 from urllib.parse import urljoin
 
+from pydantic import TypeAdapter
+
 from .api_models import (
     AccountInfo,
     Project,
@@ -23,6 +30,11 @@ from .scope_context_model import ScopeContext
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# List validators, built once and reused for every response
+_PROJECT_LIST = TypeAdapter(List[Project])
+_PLAN_LIST = TypeAdapter(List[ImplementationPlan])
+_TASK_LIST = TypeAdapter(List[Task])
+
 
 class NautexAPIError(Exception):
     """Custom exception for Nautex API errors."""
@@ -40,6 +52,60 @@ class NautexAPIError(Exception):
         self.response_body = response_body
 
 
+class NautexAPIUnavailableError(NautexAPIError):
+    """The API could not be reached, or kept failing with 5xx, after retries."""
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _wrap_api_errors(failure: str, not_found: Optional[str] = None):
+    """Apply the client's standard error handling to an endpoint method.
+
+    NautexAPIError is logged with the failure message and re-raised; any
+    other exception is logged and wrapped in NautexAPIError. When not_found
+    is given, a 404 is logged at debug level and the method returns None.
+    Both messages are str.format templates over the method's arguments.
+    """
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        def describe(template: str, args, kwargs) -> str:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return template.format(**bound.arguments)
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await fn(*args, **kwargs)
+            except NautexAPIError as e:
+                if not_found is not None and e.status_code == 404:
+                    logger.debug(describe(not_found, args, kwargs))
+                    return None
+                logger.error(f"{describe(failure, args, kwargs)}: {e}")
+                raise
+            except Exception as e:
+                logger.error(f"Unexpected error in {fn.__name__}: {e}")
+                raise NautexAPIError(f"Unexpected error: {str(e)}") from e
+        return wrapper
+    return decorator
+
+
 class NautexAPIClient:
     """Asynchronous HTTP client for Nautex.ai API with endpoint-specific methods."""
 
@@ -50,6 +116,20 @@ class NautexAPIClient:
     ENDPOINT_TASKS = "tasks"
     ENDPOINT_REQUIREMENTS = "requirements"
 
+    # Connection pool settings for the shared session
+    CONNECTION_LIMIT = 20
+    KEEPALIVE_TIMEOUT = 60
+    DNS_CACHE_TTL = 300
+    SOCKET_CONNECT_TIMEOUT = 3
+
+    # Longest Retry-After the client waits out before giving up on a 429
+    MAX_RETRY_AFTER = 30
+
+    # Attempts per request, and the time budget after which no retry is
+    # started; a request's own timeout replaces the budget
+    MAX_ATTEMPTS = 5
+    RETRY_DEADLINE = 120
+
     def __init__(self, base_url: str, token: Optional[str] = None):
         """Initialize the API client.
 
@@ -59,8 +139,14 @@ class NautexAPIClient:
         """
         self.base_url = base_url.rstrip('/')
         self.api_version_path = "/d/v1/"
+        self._api_root = urljoin(self.base_url, self.api_version_path)
         self._token = token
         self._session: Optional[aiohttp.ClientSession] = None
+        # Authorization header for the last token seen, rebuilt when it changes
+        self._auth_headers_token: Optional[str] = None
+        self._auth_headers: Dict[str, str] = {}
+        # Conditional GET cache: (url, Authorization) -> (ETag, parsed body)
+        self._etag_cache: Dict[Tuple[str, str], Tuple[str, Dict[str, Any]]] = {}
 
         # Latency tracking per endpoint type
         self._latency_measurements: Dict[str, List[float]] = {
@@ -80,19 +166,20 @@ class NautexAPIClient:
         """Async context manager exit."""
         await self.close()
 
-    async def _ensure_session(self, custom_timeout: Optional[float] = None):
-        """Ensure aiohttp session is created.
-
-        Args:
-            custom_timeout: Optional custom timeout in seconds
-        """
+    async def _ensure_session(self):
+        """Ensure aiohttp session is created."""
         if self._session is None or self._session.closed:
-            if custom_timeout is not None:
-                timeout = aiohttp.ClientTimeout(total=custom_timeout, connect=min(custom_timeout/2, 10))
-            else:
-                timeout = aiohttp.ClientTimeout(total=30, connect=10)
-
+            # Fail fast on an unreachable host instead of waiting out the
+            # pool-level connect timeout
+            timeout = aiohttp.ClientTimeout(total=30, connect=10, sock_connect=self.SOCKET_CONNECT_TIMEOUT)
+
+            connector = aiohttp.TCPConnector(
+                limit=self.CONNECTION_LIMIT,
+                keepalive_timeout=self.KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=self.DNS_CACHE_TTL,
+            )
             self._session = aiohttp.ClientSession(
+                connector=connector,
                 timeout=timeout,
                 headers={'Content-Type': 'application/json'}
             )
@@ -109,7 +196,8 @@ class NautexAPIClient:
         endpoint_url: str, 
         headers: Optional[Dict[str, str]] = None, 
         json_payload: Optional[Dict[str, Any]] = None,
-        timeout: Optional[float] = None
+        timeout: Optional[float] = None,
+        conditional: bool = False
     ) -> Dict[str, Any]:
         """Make an HTTP request with retry logic.
 
@@ -119,6 +207,8 @@ class NautexAPIClient:
             headers: Request headers
             json_payload: JSON request body
             timeout: Optional custom timeout in seconds
+            conditional: Revalidate a cached body with If-None-Match and
+                reuse it on 304 Not Modified
 
         Returns:
             Parsed JSON response
@@ -126,23 +216,41 @@ class NautexAPIClient:
         Raises:
             NautexAPIError: For API errors
         """
-        await self._ensure_session(timeout)
+        await self._ensure_session()
 
         # Merge headers
         request_headers = {}
         if headers:
             request_headers.update(headers)
 
+        cache_key = None
+        cached = None
+        if conditional:
+            cache_key = (endpoint_url, request_headers.get("Authorization", ""))
+            cached = self._etag_cache.get(cache_key)
+            if cached is not None:
+                request_headers["If-None-Match"] = cached[0]
+
         # Retry configuration
-        max_retries = 3
-        retry_delays = [1, 2, 4]  # Exponential backoff in seconds
+        max_retries = self.MAX_ATTEMPTS
+        retry_delays = [1, 2, 4, 8]  # Exponential backoff caps in seconds, jitter applied
+        deadline = time.monotonic() + (timeout if timeout is not None else self.RETRY_DEADLINE)
+
+        async def backoff(delay: float) -> bool:
+            """Sleep before the next attempt, unless it would run past the deadline."""
+            if attempt >= max_retries - 1 or time.monotonic() + delay >= deadline:
+                return False
+            await asyncio.sleep(delay)
+            return True
 
         last_exception = None
+        refetched = False
         endpoint_type = self._get_endpoint_type(endpoint_url)
 
         for attempt in range(max_retries):
+            cap = retry_delays[min(attempt, len(retry_delays) - 1)]
             try:
-                logger.debug(f"API request attempt {attempt + 1}/{max_retries}: {method} {endpoint_url}")
+                logger.debug("API request attempt %d/%d: %s %s", attempt + 1, max_retries, method, endpoint_url)
 
                 # Prepare request kwargs
                 request_kwargs = {
@@ -154,6 +262,15 @@ class NautexAPIClient:
                 if json_payload is not None:
                     request_kwargs['json'] = json_payload
 
+                # Custom timeouts apply to this request only; the shared
+                # session keeps its defaults for everything else
+                if timeout is not None:
+                    request_kwargs['timeout'] = aiohttp.ClientTimeout(
+                        total=timeout,
+                        connect=min(timeout/2, 10),
+                        sock_connect=min(timeout/2, self.SOCKET_CONNECT_TIMEOUT),
+                    )
+
                 # Start timing the request
                 start_time = time.time()
 
@@ -164,11 +281,13 @@ class NautexAPIClient:
                     if 200 <= response.status < 300:
                         latency = time.time() - start_time
                         self._latency_measurements[endpoint_type].append(latency)
-                        logger.debug(f"Request latency for {endpoint_type}: {latency:.3f}s")
+                        logger.debug("Request latency for %s: %.3fs", endpoint_type, latency)
 
+                        # Parse the body already read above instead of
+                        # having aiohttp decode and parse it a second time
                         try:
-                            return await response.json()
-                        except (json.JSONDecodeError, aiohttp.ContentTypeError) as e:
+                            parsed = json.loads(response_text)
+                        except json.JSONDecodeError as e:
                             logger.error(f"Failed to parse JSON response: {e}")
                             raise NautexAPIError(
                                 f"Invalid JSON response: {str(e)}", 
@@ -176,8 +295,30 @@ class NautexAPIClient:
                                 response_body=response_text
                             )
 
-                    # Handle client errors (4xx) - don't retry
-                    elif 400 <= response.status < 500:
+                        if cache_key is not None:
+                            etag = response.headers.get("ETag")
+                            if etag:
+                                self._etag_cache[cache_key] = (etag, parsed)
+                            else:
+                                self._etag_cache.pop(cache_key, None)
+                        return parsed
+
+                    # Cached body is still current
+                    elif response.status == 304 and cached is not None:
+                        logger.debug("Not modified, reusing cached response: %s", endpoint_url)
+                        return cached[1]
+
+                    # Nothing cached to reuse (e.g. a proxy revalidating for an
+                    # earlier process); ask once more for the full body
+                    elif response.status == 304 and not refetched:
+                        logger.debug("Not modified without a cached body, refetching: %s", endpoint_url)
+                        request_headers.pop("If-None-Match", None)
+                        request_headers["Cache-Control"] = "no-cache"
+                        refetched = True
+                        continue
+
+                    # Handle client errors (4xx) - don't retry, except rate limiting
+                    elif 400 <= response.status < 500 and response.status != 429:
                         # logger.error(f"Client error {response.status}: {response_text}")
                         raise NautexAPIError(
                             f"Client error {response.status}: {response_text}",
@@ -185,20 +326,35 @@ class NautexAPIClient:
                             response_body=response_text
                         )
 
-                    # Handle server errors (5xx) - retry these
-                    elif response.status >= 500:
-                        error_msg = f"Server error {response.status}: {response_text}"
+                    # Handle server errors (5xx) and rate limiting (429) - retry these
+                    elif response.status >= 500 or response.status == 429:
+                        if response.status == 429:
+                            kind, error_cls = "Rate limited", NautexAPIError
+                        else:
+                            kind, error_cls = "Server error", NautexAPIUnavailableError
+                        error_msg = f"{kind} {response.status}: {response_text}"
                         logger.warning(f"Attempt {attempt + 1} failed: {error_msg}")
-                        last_exception = NautexAPIError(
+                        last_exception = error_cls(
                             error_msg,
                             status_code=response.status,
                             response_body=response_text
                         )
 
-                        # Don't sleep after the last attempt
-                        if attempt < max_retries - 1:
-                            await asyncio.sleep(retry_delays[attempt])
-                        continue
+                        if response.status == 429:
+                            # Wait as long as the server asks; without a hint keep
+                            # at least half the backoff so retries don't pile in
+                            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+                            if retry_after is None:
+                                delay = random.uniform(cap / 2, cap)
+                            elif retry_after <= self.MAX_RETRY_AFTER:
+                                delay = retry_after
+                            else:
+                                raise last_exception
+                        else:
+                            delay = random.uniform(0, cap)
+                        if await backoff(delay):
+                            continue
+                        break
 
                     else:
                         # Unexpected status code
@@ -214,21 +370,33 @@ class NautexAPIClient:
                 # Network-level errors - retry these
                 error_msg = f"Network error: {str(e)}"
                 logger.warning(f"Attempt {attempt + 1} failed: {error_msg}")
-                last_exception = NautexAPIError(f"Network error after {max_retries} attempts: {str(e)}")
+                last_exception = NautexAPIUnavailableError(f"Network error after {attempt + 1} attempts: {str(e)}")
+                # Keep the transport error for callers that classify failures
+                last_exception.__cause__ = e
 
-                # Don't sleep after the last attempt
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(retry_delays[attempt])
-                continue
+                if await backoff(random.uniform(0, cap)):
+                    continue
+                break
 
             except NautexAPIError:
                 # Re-raise our own exceptions (4xx errors, JSON parsing errors, etc.)
                 raise
 
+            except asyncio.TimeoutError as e:
+                # Retried like network errors; with a caller's timeout the
+                # deadline has passed by now, so short checks still fail fast
+                logger.warning(f"Attempt {attempt + 1} timed out: {method} {endpoint_url}")
+                last_exception = NautexAPIUnavailableError(f"Request timed out after {attempt + 1} attempts")
+                last_exception.__cause__ = e
+
+                if await backoff(random.uniform(0, cap)):
+                    continue
+                break
+
             except Exception as e:
                 # Unexpected errors - don't retry
                 logger.error(f"Unexpected error: {str(e)}")
-                raise NautexAPIError(f"Unexpected error: {str(e)}")
+                raise NautexAPIError(f"Unexpected error: {str(e)}") from e
 
         # If we get here, all retries failed
         if last_exception:
@@ -236,7 +404,7 @@ class NautexAPIClient:
         else:
             raise NautexAPIError(f"Request failed after {max_retries} attempts")
 
-    async def get(self, endpoint_url: str, headers: Dict[str, str], timeout: Optional[float] = None, from_mcp: bool = False, silent: bool = False) -> APIResponse:
+    async def get(self, endpoint_url: str, headers: Dict[str, str], timeout: Optional[float] = None, from_mcp: bool = False, silent: bool = False, conditional: bool = False) -> APIResponse:
         """Make a GET request.
 
         Args:
@@ -245,6 +413,7 @@ class NautexAPIClient:
             timeout: Optional custom timeout in seconds
             from_mcp: Whether the request is coming from MCP
             silent: Whether to skip backend touch/tracking flags
+            conditional: Whether to revalidate a cached response via ETag
 
         Returns:
             Parsed JSON response
@@ -257,7 +426,7 @@ class NautexAPIClient:
             separator = "&" if "?" in endpoint_url else "?"
             endpoint_url += f"{separator}silent=true"
 
-        resp = await self._request("GET", endpoint_url, headers, timeout=timeout)
+        resp = await self._request("GET", endpoint_url, headers, timeout=timeout, conditional=conditional)
         return APIResponse(**resp)
 
     async def post(
@@ -310,14 +479,19 @@ class NautexAPIClient:
             NautexAPIError: If no token is set
         """
 
-        tkn = self._get_token() if not token_override else token_override
+        if token_override:
+            return {"Authorization": f"Bearer {token_override}"}
+
+        tkn = self._get_token()
 
         if not tkn:
             raise NautexAPIError("No API token set. Call setup_token() first.")
 
-        return {
-            "Authorization": f"Bearer {tkn}"
-        }
+        # Callers only read the returned dict (_request copies it), so it is shared
+        if tkn != self._auth_headers_token:
+            self._auth_headers = {"Authorization": f"Bearer {tkn}"}
+            self._auth_headers_token = tkn
+        return self._auth_headers
 
     def _get_full_api_url(self, endpoint_path: str) -> str:
         """Construct full API URL from endpoint path.
@@ -328,15 +502,22 @@ class NautexAPIClient:
         Returns:
             Complete API URL
         """
-        # Clean up endpoint path - remove leading slash if present
-        endpoint_path = endpoint_path.lstrip('/')
+        # The versioned root is joined once in __init__ and ends with '/'
+        return self._api_root + endpoint_path.lstrip('/')
 
-        # Construct URL using urljoin for proper path handling
-        base_with_version = urljoin(self.base_url, self.api_version_path)
-        full_url = urljoin(base_with_version, endpoint_path)
+    def _plan_url(self, project_id: str, plan_id: str, endpoint_path: str = "") -> str:
+        """Construct a full API URL under a project's implementation plan.
 
-        logger.debug(f"Constructed API URL: {full_url}")
-        return full_url
+        Args:
+            project_id: ID of the project
+            plan_id: ID of the implementation plan
+            endpoint_path: Path below the plan (e.g., "scope/next"), empty for the plan itself
+
+        Returns:
+            Complete API URL
+        """
+        url = f"{self._api_root}{self.ENDPOINT_PROJECTS}/{project_id}/{self.ENDPOINT_PLANS}/{plan_id}"
+        return f"{url}/{endpoint_path}" if endpoint_path else url
 
     def _get_endpoint_type(self, url: str) -> str:
         """Determine the endpoint type from the URL.
@@ -445,8 +626,9 @@ class NautexAPIClient:
             raise
         except Exception as e:
             logger.error(f"Unexpected error in get_account_info: {e}")
-            raise NautexAPIError(f"Unexpected error: {str(e)}")
+            raise NautexAPIError(f"Unexpected error: {str(e)}") from e
 
+    @_wrap_api_errors("Failed to list projects")
     async def list_projects(self, silent: bool = False) -> List[Project]:
         """List all projects available to the user.
 
@@ -462,20 +644,13 @@ class NautexAPIClient:
         headers = self._get_auth_headers()
         url = self._get_full_api_url(self.ENDPOINT_PROJECTS)
 
-        try:
-            response = await self.get(url, headers, silent=silent)
-
-            # Parse response into list of Project models
-            projects_data = response.data.get('projects', [])
-            return [Project.model_validate(project) for project in projects_data]
+        response = await self.get(url, headers, silent=silent, conditional=True)
 
-        except NautexAPIError as e:
-            logger.error(f"Failed to list projects: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in list_projects: {e}")
-            raise NautexAPIError(f"Unexpected error: {str(e)}")
+        # Parse response into list of Project models
+        projects_data = response.data.get('projects', [])
+        return _PROJECT_LIST.validate_python(projects_data)
 
+    @_wrap_api_errors("Failed to list implementation plans for project {project_id}")
     async def list_implementation_plans(self, project_id: str, from_mcp: bool = False) -> List[ImplementationPlan]:
         """List implementation plans for a specific project.
 
@@ -492,20 +667,13 @@ class NautexAPIClient:
         headers = self._get_auth_headers()
         url = self._get_full_api_url(f"{self.ENDPOINT_PROJECTS}/{project_id}/{self.ENDPOINT_PLANS}")
 
-        try:
-            response_data = await self.get(url, headers, from_mcp=from_mcp)
-
-            # Parse response into list of ImplementationPlan models
-            plans_data = response_data.data.get('plans', [])
-            return [ImplementationPlan.model_validate(plan) for plan in plans_data]
+        response_data = await self.get(url, headers, from_mcp=from_mcp, conditional=True)
 
-        except NautexAPIError as e:
-            logger.error(f"Failed to list implementation plans for project {project_id}: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in list_implementation_plans: {e}")
-            raise NautexAPIError(f"Unexpected error: {str(e)}")
+        # Parse response into list of ImplementationPlan models
+        plans_data = response_data.data.get('plans', [])
+        return _PLAN_LIST.validate_python(plans_data)
 
+    @_wrap_api_errors("Failed to get next task for project {project_id}, plan {plan_id}")
     async def get_next_task(self, project_id: str, plan_id: str, from_mcp: bool = False) -> Optional[Task]:
         """Get the next available task for a project/plan.
 
@@ -521,30 +689,23 @@ class NautexAPIClient:
             NautexAPIError: If API call fails
         """
         headers = self._get_auth_headers()
-        url = self._get_full_api_url(f"{self.ENDPOINT_PROJECTS}/{project_id}/{self.ENDPOINT_PLANS}/{plan_id}/{self.ENDPOINT_TASKS}/next")
-
-        try:
-            response_data = await self.get(url, headers, from_mcp=from_mcp)
+        url = self._plan_url(project_id, plan_id, f"{self.ENDPOINT_TASKS}/next")
 
-            # Handle case where no task is available
-            if not response_data or 'task' not in response_data:
-                logger.debug(f"No next task available for project {project_id}, plan {plan_id}")
-                return None
+        response_data = await self.get(url, headers, from_mcp=from_mcp)
 
-            task_data = response_data['task']
-            if not task_data:
-                return None
+        # Handle case where no task is available
+        if not response_data or 'task' not in response_data:
+            logger.debug("No next task available for project %s, plan %s", project_id, plan_id)
+            return None
 
-            logger.debug(f"Successfully retrieved next task for project {project_id}, plan {plan_id}")
-            return Task.model_validate(task_data)
+        task_data = response_data['task']
+        if not task_data:
+            return None
 
-        except NautexAPIError as e:
-            logger.error(f"Failed to get next task for project {project_id}, plan {plan_id}: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in get_next_task: {e}")
-            raise NautexAPIError(f"Unexpected error: {str(e)}")
+        logger.debug("Successfully retrieved next task for project %s, plan %s", project_id, plan_id)
+        return Task.model_validate(task_data)
 
+    @_wrap_api_errors("Failed to get tasks info for project {project_id}, plan {plan_id}")
     async def get_tasks_info(
         self, 
         project_id: str, 
@@ -566,29 +727,27 @@ class NautexAPIClient:
         Raises:
             NautexAPIError: If API call fails
         """
+        # Nothing to look up - skip the round-trip
+        if not task_designators:
+            return []
+
         headers = self._get_auth_headers()
-        url = self._get_full_api_url(f"{self.ENDPOINT_PROJECTS}/{project_id}/{self.ENDPOINT_PLANS}/{plan_id}/{self.ENDPOINT_TASKS}")
+        url = self._plan_url(project_id, plan_id, self.ENDPOINT_TASKS)
 
         # Create request payload
         request_data = {
             "task_designators": task_designators
         }
 
-        try:
-            response_data = await self.post(url, headers, request_data, from_mcp=from_mcp)
-            logger.debug(f"Successfully retrieved {len(response_data.get('tasks', []))} tasks for project {project_id}, plan {plan_id}")
-
-            # Parse response into list of Task models
-            tasks_data = response_data.get('tasks', [])
-            return [Task.model_validate(task) for task in tasks_data]
+        response_data = await self.post(url, headers, request_data, from_mcp=from_mcp)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Successfully retrieved %d tasks for project %s, plan %s", len(response_data.get('tasks', [])), project_id, plan_id)
 
-        except NautexAPIError as e:
-            logger.error(f"Failed to get tasks info for project {project_id}, plan {plan_id}: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in get_tasks_info: {e}")
-            raise NautexAPIError(f"Unexpected error: {str(e)}")
+        # Parse response into list of Task models
+        tasks_data = response_data.get('tasks', [])
+        return _TASK_LIST.validate_python(tasks_data)
 
+    @_wrap_api_errors("Failed to update task {task_designator} status")
     async def update_task_status(
         self, 
         project_id: str, 
@@ -613,28 +772,21 @@ class NautexAPIClient:
             NautexAPIError: If API call fails
         """
         headers = self._get_auth_headers()
-        url = self._get_full_api_url(f"{self.ENDPOINT_PROJECTS}/{project_id}/{self.ENDPOINT_PLANS}/{plan_id}/{self.ENDPOINT_TASKS}/{task_designator}/status")
+        url = self._plan_url(project_id, plan_id, f"{self.ENDPOINT_TASKS}/{task_designator}/status")
 
         # Create request payload
         request_data = {
             "status": status
         }
 
-        try:
-            response_data = await self.post(url, headers, request_data, from_mcp=from_mcp)
-            logger.debug(f"Successfully updated task {task_designator} status to {status}")
-
-            # Parse response into Task model
-            task_data = response_data.get('task', response_data)
-            return Task.model_validate(task_data)
+        response_data = await self.post(url, headers, request_data, from_mcp=from_mcp)
+        logger.debug("Successfully updated task %s status to %s", task_designator, status)
 
-        except NautexAPIError as e:
-            logger.error(f"Failed to update task {task_designator} status: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in update_task_status: {e}")
-            raise NautexAPIError(f"Unexpected error: {str(e)}")
+        # Parse response into Task model
+        task_data = response_data.get('task', response_data)
+        return Task.model_validate(task_data)
 
+    @_wrap_api_errors("Failed to add note to task {task_designator}")
     async def add_task_note(
         self, 
         project_id: str, 
@@ -659,32 +811,25 @@ class NautexAPIClient:
             NautexAPIError: If API call fails
         """
         headers = self._get_auth_headers()
-        url = self._get_full_api_url(f"{self.ENDPOINT_PROJECTS}/{project_id}/{self.ENDPOINT_PLANS}/{plan_id}/{self.ENDPOINT_TASKS}/{task_designator}/notes")
+        url = self._plan_url(project_id, plan_id, f"{self.ENDPOINT_TASKS}/{task_designator}/notes")
 
         # Create request payload
         request_data = {
             "content": content
         }
 
-        try:
-            response_data = await self.post(url, headers, request_data, from_mcp=from_mcp)
-            logger.debug(f"Successfully added note to task {task_designator}")
-
-            # Return confirmation
-            return {
-                "task_designator": task_designator,
-                "status": "note_added",
-                "note_id": response_data.get("note_id"),
-                "timestamp": response_data.get("timestamp")
-            }
+        response_data = await self.post(url, headers, request_data, from_mcp=from_mcp)
+        logger.debug("Successfully added note to task %s", task_designator)
 
-        except NautexAPIError as e:
-            logger.error(f"Failed to add note to task {task_designator}: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in add_task_note: {e}")
-            raise NautexAPIError(f"Unexpected error: {str(e)}")
+        # Return confirmation
+        return {
+            "task_designator": task_designator,
+            "status": "note_added",
+            "note_id": response_data.get("note_id"),
+            "timestamp": response_data.get("timestamp")
+        }
 
+    @_wrap_api_errors("Failed to execute batch task update")
     async def update_tasks_batch(
         self, 
         project_id: str, 
@@ -711,25 +856,18 @@ class NautexAPIClient:
         """
 
         headers = self._get_auth_headers()
-        url = self._get_full_api_url(f"{self.ENDPOINT_PROJECTS}/{project_id}/{self.ENDPOINT_PLANS}/{plan_id}/tasks_update")
+        url = self._plan_url(project_id, plan_id, "tasks_update")
 
         # Create request payload
         request_data = TaskOperationRequest(operations=operations).model_dump()
 
-        try:
-            response_data = await self.post(url, headers, request_data, from_mcp=from_mcp)
-            logger.debug(f"Successfully executed batch update for {len(operations)} tasks")
-
-            # Return the API response
-            return response_data
+        response_data = await self.post(url, headers, request_data, from_mcp=from_mcp)
+        logger.debug("Successfully executed batch update for %d tasks", len(operations))
 
-        except NautexAPIError as e:
-            logger.error(f"Failed to execute batch task update: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in update_tasks_batch: {e}")
-            raise NautexAPIError(f"Unexpected error: {str(e)}")
+        # Return the API response
+        return response_data
 
+    @_wrap_api_errors("Failed to submit change request")
     async def submit_change_request(
         self,
         project_id: str,
@@ -752,17 +890,11 @@ class NautexAPIClient:
         headers = self._get_auth_headers()
         url = self._get_full_api_url(f"{self.ENDPOINT_PROJECTS}/{project_id}/change_request")
 
-        try:
-            response_data = await self.post(url, headers, payload.model_dump(), from_mcp=from_mcp)
-            logger.debug(f"Successfully submitted change request for project {project_id}")
-            return response_data
-        except NautexAPIError as e:
-            logger.error(f"Failed to submit change request: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in submit_change_request: {e}")
-            raise NautexAPIError(f"Unexpected error: {str(e)}")
+        response_data = await self.post(url, headers, payload.model_dump(), from_mcp=from_mcp)
+        logger.debug("Successfully submitted change request for project %s", project_id)
+        return response_data
 
+    @_wrap_api_errors("Failed to get document tree for {doc_designator}", not_found="Document {doc_designator} not found for project {project_id}")
     async def get_document_tree(self, project_id: str, doc_designator: str, from_mcp: bool = False) -> Optional[Document]:
         """
         Get a document tree by designator.
@@ -779,29 +911,18 @@ class NautexAPIClient:
         headers = self._get_auth_headers()
         url = self._get_full_api_url(f"{self.ENDPOINT_PROJECTS}/{project_id}/documents/{doc_designator}/tree")
 
-        try:
-            response = await self.get(url, headers, from_mcp=from_mcp)
-
-            # Handle APIResponse wrapper
-            if response.status == "success" and response.data:
-                document_data = response.data.get("document")
-                if document_data:
-                    return Document.model_validate(document_data)
-                return None
-            else:
-                raise NautexAPIError(f"Unexpected response format: {response}")
+        response = await self.get(url, headers, from_mcp=from_mcp)
 
-        except NautexAPIError as e:
-            if e.status_code == 404:
-                # Document not found
-                logger.debug(f"Document {doc_designator} not found for project {project_id}")
-                return None
-            logger.error(f"Failed to get document tree for {doc_designator}: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in get_document_tree: {e}")
-            raise NautexAPIError(f"Unexpected error: {str(e)}")
+        # Handle APIResponse wrapper
+        if response.status == "success" and response.data:
+            document_data = response.data.get("document")
+            if document_data:
+                return Document.model_validate(document_data)
+            return None
+        else:
+            raise NautexAPIError(f"Unexpected response format: {response}")
 
+    @_wrap_api_errors("Failed to get implementation plan {plan_id} for project {project_id}", not_found="Implementation plan {plan_id} not found for project {project_id}")
     async def get_implementation_plan(self, project_id: str, plan_id: str, from_mcp: bool = False, silent: bool = False) -> Optional[ImplementationPlan]:
         """Get a specific implementation plan by plan_id.
 
@@ -819,31 +940,20 @@ class NautexAPIClient:
         """
 
         headers = self._get_auth_headers()
-        url = self._get_full_api_url(f"{self.ENDPOINT_PROJECTS}/{project_id}/{self.ENDPOINT_PLANS}/{plan_id}")
+        url = self._plan_url(project_id, plan_id)
 
-        try:
-            response = await self.get(url, headers, from_mcp=from_mcp, silent=silent)
-
-            # Handle APIResponse wrapper
-            if response.status == "success" and response.data:
-                plan_data = response.data.get("plan")
-                if plan_data:
-                    return ImplementationPlan.model_validate(plan_data)
-                return None
-            else:
-                raise NautexAPIError(f"Unexpected response format: {response}")
+        response = await self.get(url, headers, from_mcp=from_mcp, silent=silent)
 
-        except NautexAPIError as e:
-            if e.status_code == 404:
-                # Plan not found
-                logger.debug(f"Implementation plan {plan_id} not found for project {project_id}")
-                return None
-            logger.error(f"Failed to get implementation plan {plan_id} for project {project_id}: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in get_implementation_plan: {e}")
-            raise NautexAPIError(f"Unexpected error: {str(e)}")
+        # Handle APIResponse wrapper
+        if response.status == "success" and response.data:
+            plan_data = response.data.get("plan")
+            if plan_data:
+                return ImplementationPlan.model_validate(plan_data)
+            return None
+        else:
+            raise NautexAPIError(f"Unexpected response format: {response}")
 
+    @_wrap_api_errors("Failed to get next scope for project {project_id}, plan {plan_id}", not_found="No next scope available for project {project_id}, plan {plan_id}")
     async def get_next_scope(self, project_id: str, plan_id: str, from_mcp: bool = False) -> Optional[ScopeContext]:
         """Get the next scope for a specific project and plan.
 
@@ -860,30 +970,18 @@ class NautexAPIClient:
         """
 
         headers = self._get_auth_headers()
-        url = self._get_full_api_url(f"{self.ENDPOINT_PROJECTS}/{project_id}/{self.ENDPOINT_PLANS}/{plan_id}/scope/next")
-
-        try:
-            response = await self.get(url, headers, from_mcp=from_mcp)
+        url = self._plan_url(project_id, plan_id, "scope/next")
 
-            # Handle case where no scope is available
-            if not response.data or 'scope' not in response.data:
-                logger.debug(f"No next scope available for project {project_id}, plan {plan_id}")
-                return None
+        response = await self.get(url, headers, from_mcp=from_mcp)
 
-            scope_data = response.data.get('scope')
-            if not scope_data:
-                return None
+        # Handle case where no scope is available
+        if not response.data or 'scope' not in response.data:
+            logger.debug("No next scope available for project %s, plan %s", project_id, plan_id)
+            return None
 
-            logger.debug(f"Successfully retrieved next scope for project {project_id}, plan {plan_id}")
-            return ScopeContext.model_validate(scope_data)
+        scope_data = response.data.get('scope')
+        if not scope_data:
+            return None
 
-        except NautexAPIError as e:
-            if e.status_code == 404:
-                # No next scope found
-                logger.debug(f"No next scope available for project {project_id}, plan {plan_id}")
-                return None
-            logger.error(f"Failed to get next scope for project {project_id}, plan {plan_id}: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in get_next_scope: {e}")
-            raise NautexAPIError(f"Unexpected error: {str(e)}")
+        logger.debug("Successfully retrieved next scope for project %s, plan %s", project_id, plan_id)
+        return ScopeContext.model_validate(scope_data)
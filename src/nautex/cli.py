@@ -18,6 +18,7 @@ from .services.nautex_api_service import NautexAPIService
 from .services.document_service import DocumentService
 from .services.ui_service import UIService
 from .api import create_api_client
+from .utils.event_loop import install_uvloop
 from . import __version__
 
 
@@ -219,6 +220,7 @@ def main() -> None:
         has_cli_args = any([args.token, args.project, args.plan, args.agent])
         if has_cli_args:
             from .setup_noninteractive import run_noninteractive_setup
+            install_uvloop()
             asyncio.run(run_noninteractive_setup(args, config_service))
         else:
             # Setup requires the full service stack for TUI
@@ -239,6 +241,7 @@ def main() -> None:
                 mcp_config_service=mcp_config_service,
                 agent_rules_service=agent_rules_service,
             )
+            install_uvloop()
             asyncio.run(ui_service.handle_setup_command())
 
     elif args.command == "mcp":
@@ -290,6 +293,7 @@ def main() -> None:
             nautex_api_service=nautex_api_service,
             document_service=document_service,
         )
+        install_uvloop()
         asyncio.run(run_cli_command(args.command, args, config_service))
 
 
@@ -3,10 +3,14 @@
 Each mcp_handle_*() function contains the business logic for a command.
 """
 
+import functools
 import logging
 import re
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional
 
+from pydantic import TypeAdapter
+
 from .api.api_models import TaskOperation, SubmitChangeRequestPayload
 from .api.client import NautexAPIError
 from .api.scope_context_model import TaskStatus
@@ -18,7 +22,6 @@ from .models.mcp import (
     MCPPlanInfo,
     MCPProjectInfo,
     MCPStatusResponse,
-    MCPTaskOperation,
     MCPTaskUpdateResponse,
     convert_scope_context_to_mcp_response,
 )
@@ -28,6 +31,10 @@ from . import __version__
 
 logger = logging.getLogger(__name__)
 
+# Built once: map API models onto MCP list items in a single pydantic-core pass
+_PROJECT_INFO_LIST = TypeAdapter(List[MCPProjectInfo])
+_PLAN_INFO_LIST = TypeAdapter(List[MCPPlanInfo])
+
 # ---------------------------------------------------------------------------
 # Service instance (set by services/init.py to break circular imports)
 # ---------------------------------------------------------------------------
@@ -46,14 +53,19 @@ def _get_service():
     return _service_instance
 
 
-def _check_configured():
-    svc = _get_service()
+# Read-only error payload shared by every unconfigured tool call
+_NOT_CONFIGURED_RESPONSE = MappingProxyType({
+    "success": False,
+    "error": f"Nautex MCP is not configured. Run '{CMD_NAUTEX_SETUP}' to configure the CLI first.",
+    "configured": False,
+})
+
+
+def _check_configured(svc=None):
+    if svc is None:
+        svc = _get_service()
     if not svc.is_configured():
-        return False, {
-            "success": False,
-            "error": f"Nautex MCP is not configured. Run '{CMD_NAUTEX_SETUP}' to configure the CLI first.",
-            "configured": False,
-        }
+        return False, _NOT_CONFIGURED_RESPONSE
     return True, None
 
 
@@ -110,6 +122,28 @@ def sanitize_pydantic_error_message(exc: BaseException) -> str:
     return msg
 
 
+def _map_tool_errors(response_cls, tool_name: str, sanitize: bool = False):
+    """Map errors escaping a handler onto a failed response_cls.
+
+    API errors are prefixed with "API error:"; anything else is reported
+    as-is, with Pydantic help URLs stripped when sanitize is set.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await fn(*args, **kwargs)
+            except NautexAPIError as e:
+                logger.error("API error in %s tool: %s", tool_name, e)
+                return response_cls(success=False, error=f"API error: {str(e)}")
+            except Exception as e:
+                logger.error("Error in %s tool: %s", tool_name, e)
+                error = sanitize_pydantic_error_message(e) if sanitize else str(e)
+                return response_cls(success=False, error=error)
+        return wrapper
+    return decorator
+
+
 # ---------------------------------------------------------------------------
 # Handlers
 # ---------------------------------------------------------------------------
@@ -119,7 +153,7 @@ async def mcp_handle_status() -> MCPStatusResponse:
     service = _get_service()
     try:
         logger.debug("Executing status tool")
-        status = await service.integration_status_service.get_integration_status()
+        status = await service.get_integration_status()
 
         if service.config.project_id and service.config.plan_id:
             try:
@@ -147,75 +181,48 @@ async def mcp_handle_status() -> MCPStatusResponse:
         )
 
 
+@_map_tool_errors(MCPListProjectsResponse, "list projects")
 async def mcp_handle_list_projects() -> MCPListProjectsResponse:
     """List all available projects."""
-    try:
-        logger.debug("Executing list projects tool")
-        service = _get_service()
-
-        if not service.is_configured():
-            return MCPListProjectsResponse(
-                success=False,
-                error=f"Nautex CLI is not configured. Run '{CMD_NAUTEX_SETUP}' to configure the CLI first.",
-                configured=False,
-            )
+    logger.debug("Executing list projects tool")
+    service = _get_service()
 
-        projects = await service.nautex_api_service.list_projects()
+    if not service.is_configured():
         return MCPListProjectsResponse(
-            success=True,
-            projects=[
-                MCPProjectInfo(
-                    project_id=project.project_id,
-                    name=project.name,
-                    description=project.description,
-                )
-                for project in projects
-            ],
+            success=False,
+            error=f"Nautex CLI is not configured. Run '{CMD_NAUTEX_SETUP}' to configure the CLI first.",
+            configured=False,
         )
 
-    except NautexAPIError as e:
-        logger.error(f"API error in list projects tool: {e}")
-        return MCPListProjectsResponse(success=False, error=f"API error: {str(e)}")
-    except Exception as e:
-        logger.error(f"Error in list projects tool: {e}")
-        return MCPListProjectsResponse(success=False, error=str(e))
+    projects = await service.nautex_api_service.list_projects()
+    return MCPListProjectsResponse(
+        success=True,
+        projects=_PROJECT_INFO_LIST.validate_python(projects, from_attributes=True),
+    )
 
 
+@_map_tool_errors(MCPListPlansResponse, "list plans")
 async def mcp_handle_list_plans(project_id: str) -> MCPListPlansResponse:
     """List implementation plans for a project."""
-    try:
-        logger.debug(f"Executing list plans tool for project {project_id}")
-        configured, error_response = _check_configured()
-        if not configured:
-            return MCPListPlansResponse(
-                success=False,
-                error=error_response.get("error", "Configuration error"),
-            )
-
-        plans = await _get_service().nautex_api_service.list_implementation_plans(
-            project_id, from_mcp=True
-        )
+    logger.debug("Executing list plans tool for project %s", project_id)
+    service = _get_service()
+    configured, error_response = _check_configured(service)
+    if not configured:
         return MCPListPlansResponse(
-            success=True,
-            plans=[
-                MCPPlanInfo(
-                    plan_id=plan.plan_id,
-                    project_id=plan.project_id,
-                    name=plan.name,
-                    description=plan.description,
-                )
-                for plan in plans
-            ],
+            success=False,
+            error=error_response.get("error", "Configuration error"),
         )
 
-    except NautexAPIError as e:
-        logger.error(f"API error in list plans tool: {e}")
-        return MCPListPlansResponse(success=False, error=f"API error: {str(e)}")
-    except Exception as e:
-        logger.error(f"Error in list plans tool: {e}")
-        return MCPListPlansResponse(success=False, error=str(e))
+    plans = await service.nautex_api_service.list_implementation_plans(
+        project_id, from_mcp=True
+    )
+    return MCPListPlansResponse(
+        success=True,
+        plans=_PLAN_INFO_LIST.validate_python(plans, from_attributes=True),
+    )
 
 
+@_map_tool_errors(MCPNextScopeResponse, "next scope")
 async def mcp_handle_next_scope(full: bool = False) -> MCPNextScopeResponse:
     """Get the next scope for the current project and plan.
 
@@ -223,49 +230,42 @@ async def mcp_handle_next_scope(full: bool = False) -> MCPNextScopeResponse:
         full: If True, force full scope tree. If False (default), use auto mode
               (compact with smart auto-expand rules).
     """
-    try:
-        logger.debug(f"Executing next scope tool (full={full})")
-        service = _get_service()
-
-        configured, error_response = _check_configured()
-        if not configured:
-            return MCPNextScopeResponse(
-                success=False,
-                error=error_response.get("error", "Configuration error"),
-            )
+    logger.debug("Executing next scope tool (full=%s)", full)
+    service = _get_service()
 
-        if not service.config.project_id or not service.config.plan_id:
-            return MCPNextScopeResponse(
-                success=False,
-                error="Project ID and implementation plan ID must be configured",
-            )
+    configured, error_response = _check_configured(service)
+    if not configured:
+        return MCPNextScopeResponse(
+            success=False,
+            error=error_response.get("error", "Configuration error"),
+        )
 
-        next_scope = await service.nautex_api_service.next_scope(
-            project_id=service.config.project_id,
-            plan_id=service.config.plan_id,
-            from_mcp=True,
+    if not service.config.project_id or not service.config.plan_id:
+        return MCPNextScopeResponse(
+            success=False,
+            error="Project ID and implementation plan ID must be configured",
         )
 
-        if next_scope:
-            docs_lut = await service.ensure_dependency_documents()
-            response_scope = convert_scope_context_to_mcp_response(next_scope, docs_lut)
-            return MCPNextScopeResponse(
-                success=True,
-                data=response_scope.render_response(
-                    get_effective_render_mode(response_scope, full)
-                ),
-            )
-        else:
-            return MCPNextScopeResponse(success=True, message="No next scope available")
+    project_id = service.config.project_id
+    plan_id = service.config.plan_id
+    next_scope = await service.nautex_api_service.next_scope(
+        project_id=project_id, plan_id=plan_id, from_mcp=True
+    )
 
-    except NautexAPIError as e:
-        logger.error(f"API error in next scope tool: {e}")
-        return MCPNextScopeResponse(success=False, error=f"API error: {str(e)}")
-    except Exception as e:
-        logger.error(f"Error in next scope tool: {e}")
-        return MCPNextScopeResponse(success=False, error=str(e))
+    if next_scope:
+        docs_lut = await service.ensure_dependency_documents()
+        response_scope = convert_scope_context_to_mcp_response(next_scope, docs_lut)
+        return MCPNextScopeResponse(
+            success=True,
+            data=response_scope.render_response(
+                get_effective_render_mode(response_scope, full)
+            ),
+        )
+    else:
+        return MCPNextScopeResponse(success=True, message="No next scope available")
 
 
+@_map_tool_errors(MCPTaskUpdateResponse, "update tasks", sanitize=True)
 async def mcp_handle_update_tasks(
     operations: List[Dict[str, Any]],
 ) -> MCPTaskUpdateResponse:
@@ -277,100 +277,77 @@ async def mcp_handle_update_tasks(
             - updated_status: Optional new status
             - new_note: Optional note to add
     """
-    try:
-        logger.debug(f"Executing update tasks tool with {len(operations)} operations")
-        service = _get_service()
+    logger.debug("Executing update tasks tool with %d operations", len(operations))
+    service = _get_service()
 
-        configured, error_response = _check_configured()
-        if not configured:
-            return MCPTaskUpdateResponse(
-                success=False,
-                error=error_response.get("error", "Configuration error"),
-            )
+    configured, _ = _check_configured(service)
+    if not configured:
+        # Constant fields, so validation can be skipped; built per call so
+        # callers never share a mutable response
+        return MCPTaskUpdateResponse.model_construct(
+            success=False, error=_NOT_CONFIGURED_RESPONSE["error"]
+        )
 
-        if not service.config.project_id or not service.config.plan_id:
+    if not service.config.project_id or not service.config.plan_id:
+        return MCPTaskUpdateResponse.model_construct(
+            success=False,
+            error="Project ID and implementation plan ID must be configured",
+        )
+
+    task_operations = []
+    for op in operations:
+        try:
+            task_operation = TaskOperation(
+                task_designator=op["task_designator"],
+                updated_status=normalize_task_status(op.get("updated_status")),
+                new_note=op.get("new_note"),
+            )
+        except Exception as e:
             return MCPTaskUpdateResponse(
-                success=False,
-                error="Project ID and implementation plan ID must be configured",
+                success=False, error=sanitize_pydantic_error_message(e)
             )
+        task_operations.append(task_operation)
 
-        mcp_task_operations = []
-        for op in operations:
-            try:
-                normalized_status = normalize_task_status(op.get("updated_status"))
-                mcp_task_operation = MCPTaskOperation(
-                    task_designator=op["task_designator"],
-                    updated_status=normalized_status,
-                    new_note=op.get("new_note"),
-                )
-            except Exception as e:
-                return MCPTaskUpdateResponse(
-                    success=False, error=sanitize_pydantic_error_message(e)
-                )
-            mcp_task_operations.append(mcp_task_operation)
-
-        task_operations = []
-        for op in mcp_task_operations:
-            try:
-                task_operation = TaskOperation(
-                    task_designator=op.task_designator,
-                    updated_status=op.updated_status,
-                    new_note=op.new_note,
-                )
-            except Exception as e:
-                return MCPTaskUpdateResponse(
-                    success=False, error=sanitize_pydantic_error_message(e)
-                )
-            task_operations.append(task_operation)
-
-        response = await service.nautex_api_service.update_tasks(
-            project_id=service.config.project_id,
-            plan_id=service.config.plan_id,
-            operations=task_operations,
-            from_mcp=True,
-        )
+    response = await service.nautex_api_service.update_tasks(
+        project_id=service.config.project_id,
+        plan_id=service.config.plan_id,
+        operations=task_operations,
+        from_mcp=True,
+    )
 
-        success = response.status == "success"
+    success = response.status == "success"
 
-        scope_data = None
-        if success:
-            try:
-                next_scope = await service.nautex_api_service.next_scope(
-                    project_id=service.config.project_id,
-                    plan_id=service.config.plan_id,
-                    from_mcp=True,
+    scope_data = None
+    if success:
+        try:
+            next_scope = await service.nautex_api_service.next_scope(
+                project_id=service.config.project_id,
+                plan_id=service.config.plan_id,
+                from_mcp=True,
+            )
+            if next_scope:
+                docs_lut = service.dependency_documents_paths
+                if not docs_lut:
+                    docs_lut = await service.ensure_dependency_documents()
+                response_scope = convert_scope_context_to_mcp_response(
+                    next_scope, docs_lut
                 )
-                if next_scope:
-                    docs_lut = service.dependency_documents_paths
-                    if not docs_lut:
-                        docs_lut = await service.ensure_dependency_documents()
-                    response_scope = convert_scope_context_to_mcp_response(
-                        next_scope, docs_lut
-                    )
-                    scope_data = response_scope.render_response(
-                        get_effective_render_mode(response_scope, full=False)
-                    )
-            except Exception as e:
-                logger.warning(f"Failed to fetch scope after update: {e}")
-
-        return MCPTaskUpdateResponse(
-            success=success,
-            updated=response.data,
-            message=response.message,
-            errors=response.errors,
-            next_scope=scope_data,
-        )
-
-    except NautexAPIError as e:
-        logger.error(f"API error in update tasks tool: {e}")
-        return MCPTaskUpdateResponse(success=False, error=f"API error: {str(e)}")
-    except Exception as e:
-        logger.error(f"Error in update tasks tool: {e}")
-        return MCPTaskUpdateResponse(
-            success=False, error=sanitize_pydantic_error_message(e)
-        )
+                scope_data = response_scope.render_response(
+                    get_effective_render_mode(response_scope, full=False)
+                )
+        except Exception as e:
+            logger.warning(f"Failed to fetch scope after update: {e}")
+
+    return MCPTaskUpdateResponse(
+        success=success,
+        updated=response.data,
+        message=response.message,
+        errors=response.errors,
+        next_scope=scope_data,
+    )
 
 
+@_map_tool_errors(MCPChangeRequestResponse, "submit_change_request", sanitize=True)
 async def mcp_handle_submit_change_request(
     request_message: str,
     designators: List[str],
@@ -379,49 +356,39 @@ async def mcp_handle_submit_change_request(
     project_id: Optional[str] = None,
 ) -> MCPChangeRequestResponse:
     """Submit a document change request. Creates or reuses a review session."""
-    try:
-        service = _get_service()
-
-        configured, error_response = _check_configured()
-        if not configured:
-            return MCPChangeRequestResponse(
-                success=False,
-                error=error_response.get("error", "Configuration error"),
-            )
-
-        effective_project_id = project_id or service.config.project_id
-        if not effective_project_id:
-            return MCPChangeRequestResponse(
-                success=False,
-                error="Project ID must be configured",
-            )
-
-        payload = SubmitChangeRequestPayload(
-            request_message=request_message,
-            designators=designators,
-            author=service.config.agent_instance_name or "Coding Agent",
-            session_id=session_id,
-            name=name,
-        )
-
-        result = await service.nautex_api_service.submit_change_request(
-            project_id=effective_project_id,
-            payload=payload,
-            from_mcp=True,
-        )
+    service = _get_service()
 
+    configured, error_response = _check_configured(service)
+    if not configured:
         return MCPChangeRequestResponse(
-            success=True,
-            session_id=result.data.get("session_id"),
-            session_url=result.data.get("session_url"),
-            message="Change request session created. User can review at the session URL.",
+            success=False,
+            error=error_response.get("error", "Configuration error"),
         )
 
-    except NautexAPIError as e:
-        logger.error(f"API error in submit_change_request tool: {e}")
-        return MCPChangeRequestResponse(success=False, error=f"API error: {str(e)}")
-    except Exception as e:
-        logger.error(f"Error in submit_change_request tool: {e}")
+    effective_project_id = project_id or service.config.project_id
+    if not effective_project_id:
         return MCPChangeRequestResponse(
-            success=False, error=sanitize_pydantic_error_message(e)
+            success=False,
+            error="Project ID must be configured",
         )
+
+    payload = SubmitChangeRequestPayload(
+        request_message=request_message,
+        designators=designators,
+        author=service.config.agent_instance_name or "Coding Agent",
+        session_id=session_id,
+        name=name,
+    )
+
+    result = await service.nautex_api_service.submit_change_request(
+        project_id=effective_project_id,
+        payload=payload,
+        from_mcp=True,
+    )
+
+    return MCPChangeRequestResponse(
+        success=True,
+        session_id=result.data.get("session_id"),
+        session_url=result.data.get("session_url"),
+        message="Change request session created. User can review at the session URL.",
+    )
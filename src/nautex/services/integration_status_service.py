@@ -2,12 +2,14 @@
 
 import logging
 import asyncio
+import time
 from typing import Optional, Tuple, Dict, Any, Callable
 from .config_service import ConfigurationService, ConfigurationError
 from .nautex_api_service import NautexAPIService
 from .mcp_config_service import MCPConfigService
 from ..utils.mcp_utils import MCPConfigStatus
 from .agent_rules_service import AgentRulesService
+from ..api.client import NautexAPIError, NautexAPIUnavailableError
 
 from ..models.integration_status import IntegrationStatus
 
@@ -57,13 +59,23 @@ class IntegrationStatusService:
         )
 
         if status.config_loaded:
-
-            await self._check_network_connectivity(status)
-            await self._check_api_connectivity(status)
-            await self._update_implementation_plan(status)
-
-            if self.config_service.config.agent_type_selected:
-                await self._check_mcp_status(status)
+            agent_selected = self.config_service.config.agent_type_selected
+
+            # Each check fills in its own fields of status, so the network
+            # round-trips and the MCP config read can overlap. Let every check
+            # finish before reporting a failure so none is left running.
+            checks = [
+                self._check_api_connectivity(status),
+                self._update_implementation_plan(status),
+            ]
+            if agent_selected:
+                checks.append(self._check_mcp_status(status))
+            results = await asyncio.gather(*checks, return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+
+            if agent_selected:
                 self._check_agent_rules_status(status)
 
         return status
@@ -80,6 +92,17 @@ class IntegrationStatusService:
         status.agent_rules_status, status.agent_rules_path = self.agent_rules_service.validate_rules()
         logger.debug(f"Agent rules status: {status.agent_rules_status}, path: {status.agent_rules_path}")
 
+    def _set_network_status(self, status: IntegrationStatus, network_ok: bool,
+                            response_time: Optional[float], error_msg: Optional[str]) -> None:
+        status.network_connected = network_ok
+        status.network_response_time = response_time
+        status.network_error = error_msg
+
+        if network_ok:
+            logger.debug(f"Network connectivity verified in {response_time:.3f}s")
+        else:
+            logger.warning(f"Network connectivity failed: {error_msg}")
+
     async def _check_network_connectivity(self, status: IntegrationStatus) -> None:
         """Test network connectivity to API host with short timeout."""
 
@@ -87,16 +110,7 @@ class IntegrationStatusService:
             logger.debug("Testing network connectivity...")
 
             network_ok, response_time, error_msg = await self._nautex_api_service.check_network_connectivity(timeout=5.0)
-
-            # Store network status as a custom attribute
-            status.network_connected = network_ok
-            status.network_response_time = response_time
-            status.network_error = error_msg
-
-            if network_ok:
-                logger.debug(f"Network connectivity verified in {response_time:.3f}s")
-            else:
-                logger.warning(f"Network connectivity failed: {error_msg}")
+            self._set_network_status(status, network_ok, response_time, error_msg)
 
         except Exception as e:
             logger.warning(f"Network connectivity check failed: {e}")
@@ -105,26 +119,53 @@ class IntegrationStatusService:
             status.network_error = str(e)
 
     async def _check_api_connectivity(self, status: IntegrationStatus) -> None:
-        """Test API connectivity with a longer timeout."""
+        """Test API connectivity, and network reachability from the same request.
+
+        Any HTTP response from the account endpoint shows the host is reachable
+        and a transport failure shows it is not; a separate network probe is only
+        made when the request was never sent.
+        """
+        status.api_response_time = None
+        start_time = time.perf_counter()
         try:
             logger.debug("Testing API connectivity...")
             acc_info = await self._nautex_api_service.get_account_info(timeout=5.0)
-            status.api_connected = bool(acc_info)
-            status.account_info = acc_info
-        except Exception as e:
-            # logger.warning(f"API connectivity check failed: {e}")
+        except NautexAPIError as e:
             status.api_connected = False
-            status.api_response_time = None
+            response_time = time.perf_counter() - start_time
+            if e.status_code is not None:
+                network_ok = e.status_code < 500
+                self._set_network_status(status, network_ok, response_time,
+                                         None if network_ok else f"API error: {str(e)}")
+            elif isinstance(e, NautexAPIUnavailableError):
+                self._set_network_status(status, False, response_time, str(e))
+            else:
+                # Failed before sending (e.g. no token set); probe the host on its own
+                await self._check_network_connectivity(status)
+            return
+        except Exception:
+            status.api_connected = False
+            await self._check_network_connectivity(status)
+            return
+
+        status.api_connected = bool(acc_info)
+        status.account_info = acc_info
+        self._set_network_status(status, True, time.perf_counter() - start_time, None)
 
     async def _update_implementation_plan(self, status: IntegrationStatus):
-        """Update the implementation plan."""
+        """Update the implementation plan.
+
+        An unreachable API leaves the plan unset so the other checks can still
+        report; any other error propagates.
+        """
         try:
             if self.config_service.config.plan_id:
                 plan = await self._nautex_api_service.get_implementation_plan(status.config.project_id, status.config.plan_id)
                 status.implementation_plan = plan
 
-        except Exception:
-            raise
+        except NautexAPIUnavailableError as e:
+            logger.warning(f"Implementation plan check failed: {e}")
+            status.implementation_plan = None
 
     def start_polling(self, on_update: Optional[Callable[[IntegrationStatus], None]] = None, interval: Optional[float] = None) -> None:
         """Start a background task to poll for integration status updates.
@@ -1,16 +1,20 @@
 """MCP server layer: FastMCP instance, MCPService class, and thin @mcp.tool wrappers."""
 
+import asyncio
 import logging
-from typing import Dict, Any, Optional, List, Union
+import time
+from typing import Dict, Any, Optional, List, Tuple, Union
 
 from fastmcp import FastMCP
 from mcp.types import TextContent
 
 from . import ConfigurationService, IntegrationStatusService
 from ..models.config import NautexConfig, MCPOutputFormat
+from ..models.integration_status import IntegrationStatus
 from .nautex_api_protocol import NautexAPIProtocol
 from ..models.mcp import format_response_as_markdown
 from .document_service import DocumentService
+from ..utils.event_loop import install_uvloop
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +35,7 @@ def mcp_server_set_service_instance(service_instance: 'MCPService') -> None:
 def mcp_server_run() -> None:
     """Run the MCP server in the main thread."""
     logger.info("Starting Nautex MCP server...")
+    install_uvloop()
     try:
         mcp.run()
     except Exception as e:
@@ -53,6 +58,20 @@ class MCPService:
     via the module-level singleton.
     """
 
+    __slots__ = (
+        "config_service",
+        "nautex_api_service",
+        "document_service",
+        "integration_status_service",
+        "_designators_paths",
+        "_documents_task",
+        "_status_cache",
+        "_status_lock",
+    )
+
+    # How long a gathered integration status is served to repeat status calls
+    STATUS_TTL = 0.5
+
     def __init__(
         self,
         config_service: ConfigurationService,
@@ -65,6 +84,9 @@ class MCPService:
         self.document_service = document_service
         self.integration_status_service = integration_status_service
         self._designators_paths: Dict[str, str] = {}
+        self._documents_task: Optional[asyncio.Task] = None
+        self._status_cache: Optional[Tuple[float, IntegrationStatus]] = None
+        self._status_lock = asyncio.Lock()
         logger.debug("MCPService initialized with FastMCP server")
 
     @property
@@ -76,24 +98,49 @@ class MCPService:
         return self.config.response_format
 
     async def ensure_dependency_documents(self) -> Dict[str, str]:
-        """Fetch dependency documents from backend and write to .nautex/docs/."""
+        """Fetch dependency documents from backend and write to .nautex/docs/.
+
+        Concurrent callers share a single in-flight download instead of each
+        fetching and writing the same documents.
+        """
+        if self._documents_task is None or self._documents_task.done():
+            self._documents_task = asyncio.ensure_future(self._download_dependency_documents())
+        # Shield so a cancelled caller doesn't abort the download for the others
+        return await asyncio.shield(self._documents_task)
+
+    async def _download_dependency_documents(self) -> Dict[str, str]:
         logger.info("Downloading dependency documents")
         try:
             doc_results = await self.document_service.ensure_plan_dependency_documents(
                 project_id=self.config.project_id,
                 plan_id=self.config.plan_id,
             )
-            successful_loads = sum(
-                1 for path in doc_results.values()
-                if not path.startswith("Error") and not path.startswith("Document")
-            )
-            logger.info(f"Downloaded {successful_loads} of {len(doc_results)} dependency documents")
+            if logger.isEnabledFor(logging.INFO):
+                successful_loads = sum(
+                    1 for path in doc_results.values()
+                    if not path.startswith(("Error", "Document"))
+                )
+                logger.info("Downloaded %d of %d dependency documents", successful_loads, len(doc_results))
             self._designators_paths = doc_results
         except Exception as e:
             logger.error(f"Error downloading dependency documents: {e}")
             raise
         return self._designators_paths
 
+    async def get_integration_status(self) -> IntegrationStatus:
+        """Integration status, reused for STATUS_TTL seconds.
+
+        Status polling from IDEs would otherwise probe the API and config
+        files on every call; concurrent callers wait for a single probe.
+        """
+        async with self._status_lock:
+            cached = self._status_cache
+            if cached is not None and time.monotonic() - cached[0] < self.STATUS_TTL:
+                return cached[1]
+            status = await self.integration_status_service.get_integration_status()
+            self._status_cache = (time.monotonic(), status)
+            return status
+
     @property
     def dependency_documents_paths(self) -> Dict[str, str]:
         """Cached document paths from last download."""
@@ -134,6 +181,10 @@ async def next_scope(full: bool = False) -> Union[List[TextContent], Dict[str, A
         else:
             text = format_response_as_markdown("Next Scope", response.model_dump(exclude_none=True))
         return [TextContent(type="text", text=text)]
+    if response.success and response.data:
+        # The rendered scope is already plain JSON data; hand it over
+        # without model_dump copying the whole tree again
+        return {"success": True, "data": response.data}
     return response.model_dump(exclude_none=True)
 
 
@@ -13,6 +13,9 @@ class NautexAPIProtocol(Protocol):
     Both NautexAPIService (real) and MockNautexAPIService (test) implement this.
     """
 
+    # Lets implementations that declare __slots__ actually drop __dict__
+    __slots__ = ()
+
     async def next_scope(
         self, project_id: str, plan_id: str, from_mcp: bool = False
     ) -> Optional[ScopeContext]:
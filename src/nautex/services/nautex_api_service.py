@@ -1,7 +1,10 @@
 """Nautex API Service for business logic and model mapping."""
 
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Tuple, Awaitable, Callable, TypeVar
+import functools
+import inspect
 import logging
+import math
 import asyncio
 import aiohttp
 from pydantic import SecretStr
@@ -9,12 +12,11 @@ import time
 
 from . import ConfigurationService
 from .nautex_api_protocol import NautexAPIProtocol
-from ..api.client import NautexAPIClient, NautexAPIError
+from ..api.client import NautexAPIClient, NautexAPIError, NautexAPIUnavailableError
 from ..api.api_models import (
     AccountInfo,
     Project,
     ImplementationPlan,
-    Task,
     APIResponse, TaskOperation,
     SubmitChangeRequestPayload
 )
@@ -22,10 +24,122 @@ from ..api.api_models import (
 # Set up logging
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Connectivity check failure messages by exception type
+_CONNECTIVITY_ERRORS = {
+    asyncio.TimeoutError: "Connection timeout",
+    aiohttp.ClientConnectorError: "Connection failed: {e}",
+}
+
+
+class _CircuitBreaker:
+    """Fail fast while the API keeps failing at the network or server level.
+
+    Only NautexAPIUnavailableError (transport failures and 5xx responses
+    after the client's retries) counts as a failure. After `threshold`
+    consecutive failures the breaker opens and calls are rejected without
+    a request until `recovery_timeout` has passed. Calls are then let
+    through again, and a single further failure re-opens it.
+    """
+
+    def __init__(self, threshold: int = 5, recovery_timeout: float = 30.0):
+        self.threshold = threshold
+        self.recovery_timeout = recovery_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+
+    def check(self) -> None:
+        """Raise NautexAPIError while the breaker is open."""
+        if self._opened_at is None:
+            return
+        remaining = self._opened_at + self.recovery_timeout - time.monotonic()
+        if remaining > 0:
+            raise NautexAPIError(f"Nautex API unavailable, retrying in {remaining:.0f}s")
+        # Half-open: probe with the next calls, one failure trips it again
+        self._opened_at = None
+        self._failures = self.threshold - 1
+
+    def record(self, error: Optional[NautexAPIError]) -> None:
+        """Record a call outcome.
+
+        Successes and client errors (4xx) show a reachable API and reset the
+        count. Errors raised before or after the request itself (no token,
+        unparseable responses) say nothing about availability and are ignored.
+        """
+        if error is None or (error.status_code is not None and error.status_code < 500):
+            self._failures = 0
+            return
+        if not isinstance(error, NautexAPIUnavailableError):
+            return
+        self._failures += 1
+        if self._failures >= self.threshold and self._opened_at is None:
+            self._opened_at = time.monotonic()
+            logger.warning("Nautex API failing, pausing requests for %.0fs", self.recovery_timeout)
+
+
+def _log_api_errors(failure: str):
+    """Log NautexAPIError raised by a service method, then re-raise it.
+
+    Calls also pass through the service's circuit breaker, so they are
+    rejected immediately while the API is known to be down, and through
+    its bulkhead, which bounds how many run against the API at once.
+    failure is a str.format template over the method's arguments.
+    """
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(self, *args, **kwargs):
+            self._breaker.check()
+            try:
+                return await self._guarded(fn, self, *args, **kwargs)
+            except NautexAPIError as e:
+                if logger.isEnabledFor(logging.ERROR):
+                    bound = signature.bind(self, *args, **kwargs)
+                    bound.apply_defaults()
+                    logger.error("%s: %s", failure.format(**bound.arguments), e)
+                raise
+        return wrapper
+    return decorator
+
+
+def _single_flight(fn):
+    """Share one in-flight call among concurrent identical calls.
+
+    Keyed by the current token and the call arguments; the shared call is
+    shielded so one caller being cancelled does not cancel it for the others.
+    Only for reads where a result fetched alongside the caller's request is
+    as good as a fresh one, not for reads that must follow a write.
+    """
+    @functools.wraps(fn)
+    async def wrapper(self, *args, **kwargs):
+        key = (fn.__name__, self.get_token(), args, tuple(sorted(kwargs.items())))
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn(self, *args, **kwargs))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+    return wrapper
+
 
 class NautexAPIService(NautexAPIProtocol):
     """Business logic layer for interacting with the Nautex.ai API."""
 
+    __slots__ = (
+        "api_client",
+        "config_service",
+        "_token_secret",
+        "_token",
+        "_breaker",
+        "_bulkhead",
+        "_inflight",
+    )
+
+    # Upper bound on concurrent API calls made through this service
+    MAX_CONCURRENT_CALLS = 10
+
     def __init__(self, api_client: NautexAPIClient, config_service: ConfigurationService):
         """Initialize the API service.
 
@@ -35,13 +149,38 @@ class NautexAPIService(NautexAPIProtocol):
         """
         self.api_client = api_client
         self.config_service = config_service
+        # Unwrapped token and the SecretStr it came from
+        self._token_secret: Optional[SecretStr] = None
+        self._token: Optional[str] = None
+        self._breaker = _CircuitBreaker()
+        self._bulkhead = asyncio.Semaphore(self.MAX_CONCURRENT_CALLS)
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
         self.api_client.setup_token(self.get_token)
 
         logger.debug("NautexAPIService initialized")
 
     def get_token(self):
-        rv = self.config_service.config.get_token()
-        return rv
+        # Reloading the config or setting a new token replaces the SecretStr,
+        # so unwrap again only when the object changes
+        secret = self.config_service.config.api_token
+        if secret is not self._token_secret:
+            self._token_secret = secret
+            self._token = secret.get_secret_value() if secret else None
+        return self._token
+
+    async def _guarded(self, call: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
+        """Run an API call inside the bulkhead and record its outcome with the breaker.
+
+        The caller checks the breaker first.
+        """
+        try:
+            async with self._bulkhead:
+                result = await call(*args, **kwargs)
+        except NautexAPIError as e:
+            self._breaker.record(e)
+            raise
+        self._breaker.record(None)
+        return result
 
 
     async def check_network_connectivity(self, timeout: float = 5.0) -> Tuple[bool, Optional[float], Optional[str]]:
@@ -54,31 +193,29 @@ class NautexAPIService(NautexAPIProtocol):
             Tuple of (is_connected, response_time, error_message)
         """
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             # Use get_account_info with the specified timeout to check connectivity
             await self.api_client.get_account_info(timeout=timeout, token_override="Not valid token for connection check")
-
-            response_time = time.time() - start_time
-            return True, response_time, None
-
         except NautexAPIError as e:
-            response_time = time.time() - start_time
+            response_time = time.perf_counter() - start_time
             # Even if we get an API error (like 401 unauthorized), it means network is reachable
             if e.status_code is not None and e.status_code < 500:
                 return True, response_time, None
-            else:
-                return False, response_time, f"API error: {str(e)}"
-        except asyncio.TimeoutError:
-            response_time = time.time() - start_time
-            return False, response_time, "Connection timeout"
-        except aiohttp.ClientConnectorError as e:
-            response_time = time.time() - start_time
-            return False, response_time, f"Connection failed: {str(e)}"
+            # The client wraps transport errors; classify by the original one,
+            # most specific registered type first
+            cause = e.__cause__
+            if cause is not None:
+                for cls in type(cause).__mro__:
+                    if cls in _CONNECTIVITY_ERRORS:
+                        return False, response_time, _CONNECTIVITY_ERRORS[cls].format(e=cause)
+            return False, response_time, f"API error: {str(e)}"
         except Exception as e:
-            response_time = time.time() - start_time
+            response_time = time.perf_counter() - start_time
             return False, response_time, f"Network error: {str(e)}"
 
+        return True, time.perf_counter() - start_time, None
+
     # Latency properties
 
     @property
@@ -97,18 +234,17 @@ class NautexAPIService(NautexAPIProtocol):
         Returns:
             Tuple of (min_latency, max_latency) in seconds
         """
-        stats = self.api_client.get_latency_stats()
-        if not stats:
+        # Single pass over per-endpoint stats; zeros mean "no measurements"
+        lowest, highest = math.inf, 0.0
+        for min_val, max_val in self.api_client.get_latency_stats().values():
+            if 0 < min_val < lowest:
+                lowest = min_val
+            if max_val > highest:
+                highest = max_val
+
+        if math.isinf(lowest) or highest == 0.0:
             return (0.0, 0.0)
-
-        # Collect all latency measurements
-        all_min_values = [min_val for min_val, _ in stats.values() if min_val > 0]
-        all_max_values = [max_val for _, max_val in stats.values() if max_val > 0]
-
-        # Calculate overall min/max
-        if all_min_values and all_max_values:
-            return (min(all_min_values), max(all_max_values))
-        return (0.0, 0.0)
+        return (lowest, highest)
 
     # For backward compatibility
     @property
@@ -132,9 +268,13 @@ class NautexAPIService(NautexAPIProtocol):
         Raises:
             NautexAPIError: If token is invalid or API call fails
         """
+        # Status refreshes land here, so it goes through the breaker and
+        # bulkhead like the decorated calls; rejections are NautexAPIError too
         try:
-            return await self.api_client.get_account_info(token_override=token_override, timeout=timeout)
-        except NautexAPIError as e:
+            self._breaker.check()
+            return await self._guarded(self.api_client.get_account_info,
+                                       token_override=token_override, timeout=timeout)
+        except NautexAPIError:
             if raise_exception:
                 raise
             return None
@@ -155,26 +295,23 @@ class NautexAPIService(NautexAPIProtocol):
         Raises:
             NautexAPIError: If token is invalid or API call fails
         """
-        if token:
-            # Temporarily set the token for verification
-            original_token = self.api_client._token
-            self.api_client.setup_token(token)
+        if token and token == self.get_token():
+            # Already the configured token: verify it as-is, nothing to store
+            token = None
 
-            try:
-                account_info = await self.api_client.get_account_info()
+        # Verify with a per-request override so the client's token is never
+        # swapped out from under concurrent requests
+        self._breaker.check()
+        account_info = await self._guarded(self.api_client.get_account_info, token_override=token)
 
-                # If verification succeeded, update config with the new token
-                self.config.api_token = SecretStr(token)
+        if token:
+            # If verification succeeded, update config with the new token
+            self.config_service.config.api_token = SecretStr(token)
 
-                return account_info
-            except Exception:
-                # Restore original token if verification failed
-                self.api_client.setup_token(original_token)
-                raise
-        else:
-            # Use the current token
-            return await self.api_client.get_account_info()
+        return account_info
 
+    @_single_flight
+    @_log_api_errors("Failed to list projects")
     async def list_projects(self, silent: bool = False) -> List[Project]:
         """List all projects available to the user.
 
@@ -187,12 +324,10 @@ class NautexAPIService(NautexAPIProtocol):
         Raises:
             NautexAPIError: If API call fails
         """
-        try:
-            return await self.api_client.list_projects(silent=silent)
-        except NautexAPIError as e:
-            logger.error(f"Failed to list projects: {e}")
-            raise
+        return await self.api_client.list_projects(silent=silent)
 
+    @_single_flight
+    @_log_api_errors("Failed to list implementation plans for project {project_id}")
     async def list_implementation_plans(self, project_id: str, from_mcp: bool = False) -> List[ImplementationPlan]:
         """List implementation plans for a specific project.
 
@@ -206,12 +341,9 @@ class NautexAPIService(NautexAPIProtocol):
         Raises:
             NautexAPIError: If API call fails
         """
-        try:
-            return await self.api_client.list_implementation_plans(project_id, from_mcp=from_mcp)
-        except NautexAPIError as e:
-            logger.error(f"Failed to list implementation plans for project {project_id}: {e}")
-            raise
+        return await self.api_client.list_implementation_plans(project_id, from_mcp=from_mcp)
 
+    @_log_api_errors("Failed to get next scope for project {project_id}, plan {plan_id}")
     async def next_scope(self, project_id: str, plan_id: str, from_mcp: bool = False) -> Optional["ScopeContext"]:
         """Get the next scope for a specific project and plan.
 
@@ -227,12 +359,9 @@ class NautexAPIService(NautexAPIProtocol):
             NautexAPIError: If API call fails
         """
 
-        try:
-            return await self.api_client.get_next_scope(project_id, plan_id, from_mcp=from_mcp)
-        except NautexAPIError as e:
-            logger.error(f"Failed to get next scope for project {project_id}, plan {plan_id}: {e}")
-            raise
+        return await self.api_client.get_next_scope(project_id, plan_id, from_mcp=from_mcp)
 
+    @_log_api_errors("Failed to execute batch task update")
     async def update_tasks(self, project_id: str, plan_id: str, operations: List["TaskOperation"], from_mcp: bool = False) -> APIResponse:
         """Update multiple tasks in a batch operation.
 
@@ -252,13 +381,10 @@ class NautexAPIService(NautexAPIProtocol):
             NautexAPIError: If API call fails
         """
 
-        try:
-            response_data = await self.api_client.update_tasks_batch(project_id, plan_id, operations, from_mcp=from_mcp)
-            return APIResponse.model_validate(response_data)
-        except NautexAPIError as e:
-            logger.error(f"Failed to execute batch task update: {e}")
-            raise
+        response_data = await self.api_client.update_tasks_batch(project_id, plan_id, operations, from_mcp=from_mcp)
+        return APIResponse.model_validate(response_data)
 
+    @_log_api_errors("Failed to submit change request")
     async def submit_change_request(
         self, project_id: str, payload: SubmitChangeRequestPayload,
         from_mcp: bool = False
@@ -276,13 +402,11 @@ class NautexAPIService(NautexAPIProtocol):
         Raises:
             NautexAPIError: If API call fails
         """
-        try:
-            response_data = await self.api_client.submit_change_request(project_id, payload, from_mcp=from_mcp)
-            return APIResponse.model_validate(response_data)
-        except NautexAPIError as e:
-            logger.error(f"Failed to submit change request: {e}")
-            raise
+        response_data = await self.api_client.submit_change_request(project_id, payload, from_mcp=from_mcp)
+        return APIResponse.model_validate(response_data)
 
+    @_single_flight
+    @_log_api_errors("Failed to get implementation plan {plan_id} for project {project_id}")
     async def get_implementation_plan(self, project_id: str, plan_id: str, from_mcp: bool = False, silent: bool = False) -> Optional["ImplementationPlan"]:
         """Get a specific implementation plan by plan_id.
 
@@ -299,12 +423,9 @@ class NautexAPIService(NautexAPIProtocol):
             NautexAPIError: If API call fails
         """
 
-        try:
-            return await self.api_client.get_implementation_plan(project_id, plan_id, from_mcp=from_mcp, silent=silent)
-        except NautexAPIError as e:
-            logger.error(f"Failed to get implementation plan {plan_id} for project {project_id}: {e}")
-            raise
+        return await self.api_client.get_implementation_plan(project_id, plan_id, from_mcp=from_mcp, silent=silent)
 
+    @_log_api_errors("Failed to get document tree for {doc_designator} in project {project_id}")
     async def get_document_tree(self, project_id: str, doc_designator: str, from_mcp: bool = False) -> Optional["Document"]:
         """Get a document tree by designator.
 
@@ -320,8 +441,4 @@ class NautexAPIService(NautexAPIProtocol):
             NautexAPIError: If API call fails
         """
 
-        try:
-            return await self.api_client.get_document_tree(project_id, doc_designator, from_mcp=from_mcp)
-        except NautexAPIError as e:
-            logger.error(f"Failed to get document tree for {doc_designator} in project {project_id}: {e}")
-            raise
+        return await self.api_client.get_document_tree(project_id, doc_designator, from_mcp=from_mcp)
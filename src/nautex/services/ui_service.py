@@ -1,18 +1,21 @@
 """UI Service for managing TUI applications and interactions."""
 
-from typing import Optional
-from pathlib import Path
-
 from ..services.config_service import ConfigurationService
 from ..services.integration_status_service import IntegrationStatusService
 from ..services.nautex_api_service import NautexAPIService
-from ..models.plan_context import PlanContext
-from ..tui.screens import SetupApp
 
 
 class UIService:
     """Service for managing TUI operations and screen orchestration."""
 
+    __slots__ = (
+        "config_service",
+        "integration_status_service",
+        "api_service",
+        "mcp_config_service",
+        "agent_rules_service",
+    )
+
     def __init__(
         self, 
         config_service: ConfigurationService,
@@ -47,6 +50,10 @@ class UIService:
         - Configuration saving
         - MCP configuration check
         """
+        # Textual is only needed here; importing it lazily keeps it off the
+        # path of every other command that imports the services package
+        from ..tui.screens import SetupApp
+
         try:
             # Create the setup app with the necessary services
             app = SetupApp(
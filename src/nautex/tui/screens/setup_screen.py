@@ -11,6 +11,7 @@ from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.screen import Screen
 from textual.widgets import Button, Footer, Static, Link
+from textual.worker import Worker, WorkerState
 
 from ..widgets import (
     ValidatedTextInput,
@@ -62,6 +63,9 @@ class SetupScreen(Screen):
         Binding("f1", "show_info_help", "Info & Help"),
     ]
 
+    # Seconds between periodic integration status refreshes
+    STATUS_POLL_INTERVAL = 5.0
+
     CSS = """
     #header {
         height: auto;
@@ -150,6 +154,8 @@ class SetupScreen(Screen):
 
         # Setup state
         self.setup_data = {}
+        # Last status refresh error shown to the user
+        self._status_error: Optional[str] = None
 
         # Create API token link (using Static with markup instead of Link)
         api_token_link = Link("Get API token from: app.nautex.ai/settings/nautex-api",
@@ -211,9 +217,10 @@ class SetupScreen(Screen):
 
     async def validate_api_token(self, value: str) -> tuple[bool, str]:
         """Validate the API token."""
-        if not value.strip():
+        stripped = value.strip()
+        if not stripped:
             return False, "API token is required"
-        if len(value.strip()) < 8:
+        if len(stripped) < 8:
             return False, "API token must be at least 8 characters"
 
         try:
@@ -320,7 +327,7 @@ class SetupScreen(Screen):
 
     async def on_project_selection_change(self, selected_item: ProjectItem) -> None:
         """Handle selection change in the first list."""
-        self.app.log(f"Project selection changed: {selected_item.name if hasattr(selected_item, 'name') else selected_item}")
+        self.app.log(f"Project selection changed: {getattr(selected_item, 'name', selected_item)}")
 
         self.config_service.config.project_id = selected_item.id
         self.config_service.save_configuration()
@@ -331,7 +338,7 @@ class SetupScreen(Screen):
 
     async def on_impl_plan_selection_change(self, selected_item: ImplementationPlanItem) -> None:
         """Handle selection change in the implementation plans list."""
-        self.app.log(f"Implementation plan selection changed: {selected_item.name if hasattr(selected_item, 'name') else selected_item}")
+        self.app.log(f"Implementation plan selection changed: {getattr(selected_item, 'name', selected_item)}")
 
         self.config_service.config.plan_id = selected_item.id
 
@@ -372,42 +379,65 @@ class SetupScreen(Screen):
 
     async def update_integration_status(self):
         status = await self.integration_status_service.get_integration_status()
+        self._status_error = None
         self._on_integration_status_update(status)
 
+    def refresh_integration_status(self) -> None:
+        """Refresh the status in the background, superseding a pending refresh.
+
+        Every status refresh goes through this one exclusive worker, so an
+        older fetch can never overwrite a newer status.
+        """
+        self.run_worker(self.update_integration_status(), group="status", exclusive=True, exit_on_error=False)
+
+    def _poll_integration_status(self) -> None:
+        """Periodic refresh; skipped while another refresh is still running."""
+        if not any(worker.group == "status" and worker.is_running for worker in self.workers):
+            self.refresh_integration_status()
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        if event.worker.group == "status" and event.state == WorkerState.ERROR:
+            # Background refreshes (including the one on mount) have no caller
+            # to report to; tell the user once per distinct error, not per poll
+            error = str(event.worker.error)
+            self.app.log(f"Error updating integration status: {error}")
+            if error != self._status_error:
+                self._status_error = error
+                self.notify(f"Could not update integration status: {error}", severity="error")
+
 
     async def on_mount(self) -> None:
-        # Get initial integration status
-        await self.update_integration_status()
+        # Get initial integration status without holding up focus and the
+        # projects load on its network round-trips
+        self.refresh_integration_status()
 
         await self._update_system_info()
         self.api_token_input.focus()
 
-        # Start polling for integration status updates
-        self.integration_status_service.start_polling(on_update=self._on_integration_status_update)
+        # Poll through the same worker as other refreshes so results apply in order
+        self.set_interval(self.STATUS_POLL_INTERVAL, self._poll_integration_status)
 
         # Load projects on start
         self.projects_list.reload()
 
-    async def on_unmount(self) -> None:
-        """Called when the screen is unmounted."""
-        # Stop polling when screen is unmounted
-        self.integration_status_service.stop_polling()
-
     def _on_integration_status_update(self, status: IntegrationStatus) -> None:
         """Callback function for integration status updates.
 
         Args:
             status: The updated integration status
         """
-        self.integration_status_widget.update_data(status)
-        self.system_info_widget.update_system_info(
-            email=status.account_info.profile_email if status.account_info else None,
-            network_delay=status.network_response_time
-        )
+        # Both panels repaint from one status; let Textual lay them out once
+        with self.app.batch_update():
+            self.integration_status_widget.update_data(status)
+            self.system_info_widget.update_system_info(
+                email=status.account_info.profile_email if status.account_info else None,
+                network_delay=status.network_response_time
+            )
 
     def _load_existing_config(self) -> None:
-        self.api_token_input.set_value(str(self.config_service.config.api_token))
-        self.agent_name_input.set_value(str(self.config_service.config.agent_instance_name))
+        config = self.config_service.config
+        self.api_token_input.set_value(str(config.api_token))
+        self.agent_name_input.set_value(str(config.agent_instance_name))
 
 
 
@@ -431,19 +461,20 @@ class SetupScreen(Screen):
     @work
     async def _run_dialog_worker(self, dialog):
         await self.app.push_screen_wait(dialog)
+        # Dialogs may write MCP config, rules or the agent type
+        self.refresh_integration_status()
         await self._update_system_info()
-        await self.update_integration_status()
 
-    async def action_show_mcp_dialog(self) -> None:
+    def action_show_mcp_dialog(self) -> None:
         dialog = MCPConfigWriteDialog(mcp_service=self.mcp_config_service)
         self.show_dialog(dialog)
 
 
-    async def action_show_agent_rules_dialog(self) -> None:
+    def action_show_agent_rules_dialog(self) -> None:
         dialog = AgentRulesWriteDialog(rules_service=self.agent_rules_service)
         self.show_dialog(dialog)
 
-    async def action_show_agent_selection_dialog(self) -> None:
+    def action_show_agent_selection_dialog(self) -> None:
         dialog = AgentSelectionDialog(
             config_service=self.config_service,
             integration_status_service=self.integration_status_service
@@ -451,7 +482,7 @@ class SetupScreen(Screen):
 
         self.show_dialog(dialog)
 
-    async def action_show_info_help(self) -> None:
+    def action_show_info_help(self) -> None:
         """Show the info and help dialog."""
         dialog = InfoHelpDialog()
         self.show_dialog(dialog)
@@ -74,6 +74,10 @@ class ValidatedTextInput(Vertical):
         display: none;       /* shown only when value changes */
         margin-right: 1;
     }
+
+    ValidatedTextInput .save-message.-shown {
+        display: block;
+    }
     """
 
     def __init__(
@@ -106,7 +110,6 @@ class ValidatedTextInput(Vertical):
 
         # Add a message for when value changes
         self.save_message = Static("press enter to save", classes="save-message")
-        self.save_message.display = False
 
         self.error_text = Static("", classes="error-row")
 
@@ -151,14 +154,14 @@ class ValidatedTextInput(Vertical):
         """Handle input value changes."""
         # Show the save message when the value changes
         self.value_changed = True
-        self.save_message.display = True
+        self.save_message.set_class(True, "-shown")
 
         # No validation here - validation happens only on Enter key press
 
     async def on_input_submitted(self, event):
         """Handle input submission (Enter key)."""
         # Always hide the save message when Enter is pressed
-        self.save_message.display = False
+        self.save_message.set_class(False, "-shown")
 
         # Validate the input when Enter is pressed
         self.set_status("wait")
@@ -227,7 +230,7 @@ class ValidatedTextInput(Vertical):
 
         # Reset the value_changed flag and hide the save message
         self.value_changed = False
-        self.save_message.display = False
+        self.save_message.set_class(False, "-shown")
 
         # Reset to neutral state unless we've already validated
         if not self.validation_occurred:
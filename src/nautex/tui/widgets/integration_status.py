@@ -45,6 +45,8 @@ class StatusDisplay(Static):
         return f"{self._disp_render_status()} {self.label_text}"
 
     def update_status(self, status_flag: Optional[bool]) -> None:
+        if status_flag == self.status_flag:
+            return
         self.set_status(status_flag)
         self.update(self._disp_render())
 
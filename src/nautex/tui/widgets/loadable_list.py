@@ -53,6 +53,10 @@ class LoadableList(Vertical):
         padding: 0 1;
     }
 
+    LoadableList .save-message.-shown {
+        display: block;
+    }
+
     /* Taller item to show animated LoadingIndicator clearly */
     LoadableList .loading-item {
         height: 3;
@@ -109,8 +113,8 @@ class LoadableList(Vertical):
 
         # Create widgets
         self.save_message = Static("press enter to save", classes="save-message")
-        self.save_message.display = False
         self.item_data = []
+        self._load_pending = False
 
         # Create the ListView
         self.list_view = ListView(classes="list-view", initial_index=None)
@@ -131,7 +135,7 @@ class LoadableList(Vertical):
         It works with both synchronous and asynchronous data loaders.
         """
         # Load initial data
-        self.app.call_later(self.load_data)
+        self._schedule_load()
 
     def reload(self):
         """Reload the list data.
@@ -141,7 +145,17 @@ class LoadableList(Vertical):
         """
         # Set loading state immediately to provide visual feedback
         self.is_loading = True
-        # Schedule the load_data method to be called in the next event loop iteration
+        self._schedule_load()
+
+    def _schedule_load(self):
+        """Schedule load_data for the next event loop iteration.
+
+        Reload requests made before the scheduled load starts collapse
+        into that one load.
+        """
+        if self._load_pending:
+            return
+        self._load_pending = True
         self.app.call_later(self.load_data)
 
     async def load_data(self):
@@ -152,6 +166,7 @@ class LoadableList(Vertical):
         Otherwise, it expects the data_loader to return just a list of items.
         """
         # Show loading state
+        self._load_pending = False
         self.is_loading = True
 
         # Clear existing items
@@ -272,9 +287,7 @@ class LoadableList(Vertical):
 
         # Show the save message when the selection changes
         self.value_changed = True
-        self.save_message.display = True
-        # Force a refresh to ensure the save message is displayed
-        self.save_message.refresh()
+        self.save_message.set_class(True, "-shown")
 
         # Post a message about the selection change
         if event.item is not None and self.list_view.index is not None and 0 <= self.list_view.index < len(self.item_data):
@@ -287,7 +300,7 @@ class LoadableList(Vertical):
             return
 
         # Hide the save message
-        self.save_message.display = False
+        self.save_message.set_class(False, "-shown")
 
         # Call the on_change callback if provided
         if self.value_changed and self.on_change and self.list_view.index is not None and 0 <= self.list_view.index < len(self.item_data):
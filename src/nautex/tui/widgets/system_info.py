@@ -45,6 +45,8 @@ class SystemInfoWidget(Vertical):
     mcp_config_status: reactive[MCPConfigStatus] = reactive(MCPConfigStatus.NOT_FOUND)
     agent_rules_status: reactive[AgentRulesStatus] = reactive(AgentRulesStatus.NOT_FOUND)
 
+    _ROW_LABELS = ("Host", "Acc Email", "ping", "Agent Type", "MCP Config", "Agent Rules")
+
     def __init__(
         self,
         **kwargs
@@ -58,6 +60,8 @@ class SystemInfoWidget(Vertical):
         # Create data table - defer column setup until mount
         self.data_table = DataTable(show_header=False, show_row_labels=False)
         self._table_initialized = False
+        # Text currently in the value cells; compared against on each update
+        self._shown_rows: tuple = ()
 
     def compose(self):
         """Compose the widget layout."""
@@ -73,6 +77,17 @@ class SystemInfoWidget(Vertical):
 
         self._setup_table()
 
+    def _row_values(self) -> tuple:
+        """Displayed text of the rows below Version, in table order."""
+        return (
+            self.host or "Not configured",
+            self.email or "Not available",
+            f"{self.network_delay:.3f}s" if self.network_delay > 0.0 else "N/A",
+            self.agent_type or "Not configured",
+            self.mcp_config_status.value,
+            self.agent_rules_status.value,
+        )
+
     def _setup_table(self) -> None:
         """Set up the data table with initial rows."""
         # Clear existing rows
@@ -80,12 +95,10 @@ class SystemInfoWidget(Vertical):
 
         # Add rows for each system info item
         self.data_table.add_row("Version", __version__)
-        self.data_table.add_row("Host", self.host or "Not configured")
-        self.data_table.add_row("Acc Email", self.email or "Not available")
-        self.data_table.add_row("ping", f"{self.network_delay:.3f}s" if self.network_delay > 0 else "N/A")
-        self.data_table.add_row("Agent Type", self.agent_type or "Not configured")
-        self.data_table.add_row("MCP Config", self.mcp_config_status.value)
-        self.data_table.add_row("Agent Rules", self.agent_rules_status.value)
+        rows = self._row_values()
+        for label, value in zip(self._ROW_LABELS, rows):
+            self.data_table.add_row(label, value)
+        self._shown_rows = rows
 
 
     async def refresh_data(self) -> None:
@@ -121,24 +134,14 @@ class SystemInfoWidget(Vertical):
         if agent_rules_status is not None:
             self.agent_rules_status = agent_rules_status
 
-        # Update table display
+        # Update table display, rewriting only the cells whose text changed
         try:
-            # Update version row (read-only, but good to keep track of index)
-            # self.data_table.update_cell_at((0, 1), __version__, update_width=True)
-            
-            # Update host row
-            self.data_table.update_cell_at((1, 1), self.host or "Not configured", update_width=True)
-            # Update email row
-            self.data_table.update_cell_at((2, 1), self.email or "Not available", update_width=True)
-            # Update network delay row
-            network_delay_text = f"{self.network_delay:.3f}s" if self.network_delay > 0.0 else "N/A"
-            self.data_table.update_cell_at((3, 1), network_delay_text, update_width=True)
-            # Update agent type row
-            self.data_table.update_cell_at((4, 1), self.agent_type or "Not configured", update_width=True)
-            # Update MCP config status row
-            self.data_table.update_cell_at((5, 1), self.mcp_config_status.value, update_width=True)
-            # Update agent rules status row
-            self.data_table.update_cell_at((6, 1), self.agent_rules_status.value, update_width=True)
+            rows = self._row_values()
+            with self.app.batch_update():
+                for row, (old, new) in enumerate(zip(self._shown_rows, rows), start=1):
+                    if old != new:
+                        self.data_table.update_cell_at((row, 1), new, update_width=True)
+            self._shown_rows = rows
 
         except Exception:
             # If table update fails, rebuild it
@@ -0,0 +1,27 @@
+"""Optional uvloop event loop support."""
+
+import asyncio
+import logging
+import sys
+
+logger = logging.getLogger(__name__)
+
+
+def install_uvloop() -> bool:
+    """Use uvloop for subsequently created asyncio loops, when available.
+
+    uvloop is an optional dependency (``pip install nautex[uvloop]``) and is
+    not supported on Windows; in either case the default loop is kept.
+
+    Returns:
+        True if the uvloop policy was installed, False otherwise
+    """
+    if sys.platform == "win32":
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("Using uvloop event loop")
+    return True
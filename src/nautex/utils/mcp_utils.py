@@ -30,10 +30,28 @@ NAUTEX_CONFIG_TEMPLATE = {
     }
 }
 
+# Required fields of the nautex entry, resolved once for validation
+_REQUIRED_COMMAND = NAUTEX_CONFIG_TEMPLATE["nautex"]["command"]
+_REQUIRED_ARGS = NAUTEX_CONFIG_TEMPLATE["nautex"]["args"]
+
+# Validation results keyed by (path, cwd), reused while the file's
+# (mtime_ns, size) signature is unchanged
+_validation_cache: Dict[Tuple[Path, Optional[Path]], Tuple[Tuple[int, int], MCPConfigStatus]] = {}
+
+
+def _invalidate_validation_cache(mcp_path: Path) -> None:
+    """Drop cached validation results for a file that is about to change."""
+    for key in [key for key in _validation_cache if key[0] == mcp_path]:
+        del _validation_cache[key]
+
 
 def validate_mcp_file(mcp_path: Path, cwd: Optional[Path] = None) -> MCPConfigStatus:
     """Validate a specific mcp.json file for correct nautex configuration.
 
+    The result is cached per (path, cwd) and reused until the file's
+    modification time or size changes, so repeated status checks cost a
+    single stat call instead of a read and parse.
+
     Args:
         mcp_path: Path to the mcp.json file
         cwd: Current working directory to validate against the cwd in the configuration.
@@ -46,8 +64,26 @@ def validate_mcp_file(mcp_path: Path, cwd: Optional[Path] = None) -> MCPConfigSt
         - MCPConfigStatus.NOT_FOUND: No mcpServers section or nautex entry found
     """
     try:
-        with open(mcp_path, 'r', encoding='utf-8') as f:
-            mcp_config = json.load(f)
+        stat_result = mcp_path.stat()
+    except OSError as e:
+        logger.error(f"Error reading/parsing mcp.json at {mcp_path}: {e}")
+        return MCPConfigStatus.MISCONFIGURED
+
+    cache_key = (mcp_path, cwd)
+    signature = (stat_result.st_mtime_ns, stat_result.st_size)
+    cached = _validation_cache.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    status = _validate_mcp_file_contents(mcp_path, cwd)
+    _validation_cache[cache_key] = (signature, status)
+    return status
+
+
+def _validate_mcp_file_contents(mcp_path: Path, cwd: Optional[Path]) -> MCPConfigStatus:
+    """Read and validate mcp.json contents, bypassing the validation cache."""
+    try:
+        mcp_config = json.loads(mcp_path.read_text(encoding='utf-8'))
 
         # Check if mcpServers section exists
         if not isinstance(mcp_config, dict) or "mcpServers" not in mcp_config:
@@ -107,14 +143,10 @@ def is_nautex_config_valid(nautex_config: Any) -> bool:
     if not isinstance(nautex_config, dict):
         return False
 
-    template_nautex_entry = NAUTEX_CONFIG_TEMPLATE.get("nautex")
-    required_command = template_nautex_entry.get("command")
-    required_args = template_nautex_entry.get("args")
-
     # Check for required fields
     has_required_fields = (
-        nautex_config.get("command") == required_command and
-        nautex_config.get("args") == required_args
+        nautex_config.get("command") == _REQUIRED_COMMAND and
+        nautex_config.get("args") == _REQUIRED_ARGS
     )
     
     # Check for cwd field - it must exist and be a string
@@ -167,16 +199,22 @@ def write_mcp_configuration(target_path: Path, cwd: Optional[Path] = None) -> bo
             logger.warning("mcpServers is not a dict, recreating")
             mcp_config["mcpServers"] = {}
 
-        # Add/update nautex entry
-        nautex_config = NAUTEX_CONFIG_TEMPLATE.copy()
-        
+        # Build the nautex entry without mutating the shared template
+        nautex_entry = dict(NAUTEX_CONFIG_TEMPLATE["nautex"])
+
         # Add cwd to the nautex configuration if provided
         if cwd is not None:
-            nautex_config["nautex"]["cwd"] = str(cwd.absolute())
-            
-        mcp_config["mcpServers"].update(nautex_config)
+            nautex_entry["cwd"] = str(cwd.absolute())
+
+        # Skip the write when the file already holds the exact entry
+        if mcp_config["mcpServers"].get("nautex") == nautex_entry:
+            logger.debug(f"Nautex MCP configuration in {target_path} is up to date, no change")
+            return True
+
+        mcp_config["mcpServers"]["nautex"] = nautex_entry
 
         # Write the configuration
+        _invalidate_validation_cache(target_path)
         with open(target_path, 'w', encoding='utf-8') as f:
             json.dump(mcp_config, f, indent=2, ensure_ascii=False)
 
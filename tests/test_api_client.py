@@ -0,0 +1,169 @@
+"""Tests for NautexAPIClient request handling against a fake HTTP session."""
+
+import asyncio
+
+import pytest
+
+from nautex.api.client import NautexAPIClient, NautexAPIError, NautexAPIUnavailableError
+
+URL = "https://api.example/d/v1/projects"
+AUTH = {"Authorization": "Bearer token"}
+
+
+class FakeResponse:
+
+    def __init__(self, status, body="{}", headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+
+    async def text(self):
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class TimeoutResponse(FakeResponse):
+
+    def __init__(self):
+        super().__init__(0)
+
+    async def __aenter__(self):
+        raise asyncio.TimeoutError()
+
+
+class FakeSession:
+    """Replays canned responses and records the headers of each request."""
+
+    closed = False
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def request(self, **kwargs):
+        self.sent_headers.append(dict(kwargs["headers"]))
+        return self.responses.pop(0)
+
+    async def close(self):
+        self.closed = True
+
+
+def make_client(*responses):
+    client = NautexAPIClient("https://api.example")
+    client._session = FakeSession(*responses)
+    return client
+
+
+class TestConditionalRequests:
+
+    @pytest.mark.asyncio
+    async def test_304_reuses_cached_body(self):
+        client = make_client(
+            FakeResponse(200, '{"projects": [1]}', {"ETag": '"v1"'}),
+            FakeResponse(304, ""),
+        )
+
+        first = await client._request("GET", URL, AUTH, conditional=True)
+        second = await client._request("GET", URL, AUTH, conditional=True)
+
+        assert first == second == {"projects": [1]}
+        sent = client._session.sent_headers
+        assert "If-None-Match" not in sent[0]
+        assert sent[1]["If-None-Match"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_304_without_cached_body_refetches(self):
+        client = make_client(
+            FakeResponse(304, ""),
+            FakeResponse(200, '{"projects": []}', {"ETag": '"v2"'}),
+        )
+
+        result = await client._request("GET", URL, AUTH, conditional=True)
+
+        assert result == {"projects": []}
+        sent = client._session.sent_headers
+        assert len(sent) == 2
+        assert "If-None-Match" not in sent[1]
+        assert sent[1]["Cache-Control"] == "no-cache"
+
+    @pytest.mark.asyncio
+    async def test_cache_is_per_token(self):
+        client = make_client(
+            FakeResponse(200, '{"projects": [1]}', {"ETag": '"v1"'}),
+            FakeResponse(200, '{"projects": [2]}', {"ETag": '"v1"'}),
+        )
+
+        await client._request("GET", URL, AUTH, conditional=True)
+        other = await client._request("GET", URL, {"Authorization": "Bearer other"}, conditional=True)
+
+        assert other == {"projects": [2]}
+        assert "If-None-Match" not in client._session.sent_headers[1]
+
+
+class TestRateLimiting:
+
+    @pytest.fixture
+    def sleeps(self, monkeypatch):
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        return delays
+
+    @pytest.mark.asyncio
+    async def test_429_honours_retry_after(self, sleeps):
+        client = make_client(
+            FakeResponse(429, "slow down", {"Retry-After": "2"}),
+            FakeResponse(200, '{"ok": true}'),
+        )
+
+        assert await client._request("GET", URL, AUTH) == {"ok": True}
+        assert sleeps == [2.0]
+
+    @pytest.mark.asyncio
+    async def test_429_without_retry_after_keeps_a_floor(self, sleeps):
+        client = make_client(
+            FakeResponse(429, "slow down"),
+            FakeResponse(200, '{"ok": true}'),
+        )
+
+        await client._request("GET", URL, AUTH)
+
+        assert len(sleeps) == 1
+        assert 0.5 <= sleeps[0] <= 1.0
+
+    @pytest.mark.asyncio
+    async def test_429_with_long_retry_after_gives_up(self, sleeps):
+        client = make_client(FakeResponse(429, "slow down", {"Retry-After": "3600"}))
+
+        with pytest.raises(NautexAPIError) as exc_info:
+            await client._request("GET", URL, AUTH)
+
+        assert exc_info.value.status_code == 429
+        assert sleeps == []
+        assert len(client._session.sent_headers) == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_is_retried(self, sleeps):
+        client = make_client(TimeoutResponse(), FakeResponse(200, '{"ok": true}'))
+
+        assert await client._request("GET", URL, AUTH) == {"ok": True}
+        assert len(sleeps) == 1
+
+    @pytest.mark.asyncio
+    async def test_caller_timeout_bounds_the_retries(self, sleeps):
+        client = make_client(TimeoutResponse(), FakeResponse(200, '{"ok": true}'))
+
+        with pytest.raises(NautexAPIUnavailableError) as exc_info:
+            await client._request("GET", URL, AUTH, timeout=0)
+
+        assert isinstance(exc_info.value.__cause__, asyncio.TimeoutError)
+        assert sleeps == []
+        assert len(client._session.sent_headers) == 1
@@ -0,0 +1,47 @@
+"""Tests for IntegrationStatusService status gathering over fake services."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from nautex.api.client import NautexAPIError, NautexAPIUnavailableError
+from nautex.services.integration_status_service import IntegrationStatusService
+
+
+class FakeAPIService:
+
+    def __init__(self, plan_error=None):
+        self.plan_error = plan_error
+
+    async def get_account_info(self, timeout=None):
+        return SimpleNamespace(profile_email="user@example.com")
+
+    async def get_implementation_plan(self, project_id, plan_id):
+        if self.plan_error is not None:
+            raise self.plan_error
+        return SimpleNamespace(plan_id=plan_id)
+
+
+def make_service(api_service):
+    config = SimpleNamespace(project_id="p1", plan_id="pl1", agent_type_selected=False)
+    config_service = SimpleNamespace(config=config)
+    return IntegrationStatusService(config_service, None, None, api_service)
+
+
+class TestImplementationPlanCheck:
+
+    @pytest.mark.asyncio
+    async def test_unavailable_api_leaves_plan_unset(self):
+        service = make_service(FakeAPIService(NautexAPIUnavailableError("Network error")))
+
+        status = await service.get_integration_status()
+
+        assert status.implementation_plan is None
+        assert status.api_connected
+
+    @pytest.mark.asyncio
+    async def test_other_errors_propagate(self):
+        service = make_service(FakeAPIService(NautexAPIError("Client error 403", status_code=403)))
+
+        with pytest.raises(NautexAPIError):
+            await service.get_integration_status()
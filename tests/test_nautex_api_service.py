@@ -0,0 +1,225 @@
+"""Tests for NautexAPIService call handling over a fake API client."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from pydantic import SecretStr
+
+from nautex.api.api_models import ImplementationPlan, Project
+from nautex.api.client import NautexAPIError, NautexAPIUnavailableError
+from nautex.services import nautex_api_service
+from nautex.services.nautex_api_service import NautexAPIService, _CircuitBreaker
+
+
+class FakeClient:
+    """Stands in for NautexAPIClient, returning whatever the test sets."""
+
+    def __init__(self):
+        self.calls = []
+        self.projects = []
+        self.plans = []
+        self.error = None
+
+    def setup_token(self, token):
+        self.token = token
+
+    async def list_projects(self, silent=False):
+        self.calls.append("list_projects")
+        if self.error is not None:
+            raise self.error
+        return list(self.projects)
+
+    async def list_implementation_plans(self, project_id, from_mcp=False):
+        self.calls.append("list_implementation_plans")
+        return list(self.plans)
+
+    async def get_account_info(self, timeout=None, token_override=None):
+        self.calls.append("get_account_info")
+        if self.error is not None:
+            raise self.error
+
+
+def make_service(client):
+    config_service = SimpleNamespace(config=SimpleNamespace(api_token=SecretStr("token")))
+    return NautexAPIService(client, config_service)
+
+
+class TestListings:
+
+    @pytest.mark.asyncio
+    async def test_reload_sees_new_plan(self):
+        client = FakeClient()
+        service = make_service(client)
+
+        assert await service.list_implementation_plans("p1") == []
+
+        client.plans = [ImplementationPlan(plan_id="pl1", project_id="p1", name="Plan")]
+        plans = await service.list_implementation_plans("p1")
+
+        assert [p.plan_id for p in plans] == ["pl1"]
+        assert client.calls == ["list_implementation_plans"] * 2
+
+    @pytest.mark.asyncio
+    async def test_every_project_listing_reaches_the_client(self):
+        client = FakeClient()
+        client.projects = [Project(project_id="p1", name="Project")]
+        service = make_service(client)
+
+        await service.list_projects()
+        await service.list_projects()
+
+        assert client.calls == ["list_projects"] * 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_listings_share_one_call(self):
+        client = FakeClient()
+        client.projects = [Project(project_id="p1", name="Project")]
+        service = make_service(client)
+
+        first, second = await asyncio.gather(service.list_projects(), service.list_projects())
+
+        assert first == second
+        assert client.calls == ["list_projects"]
+
+
+class TestCircuitBreaker:
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(nautex_api_service.time, "monotonic", lambda: now[0])
+        return now
+
+    def trip(self, breaker):
+        for _ in range(breaker.threshold):
+            breaker.record(NautexAPIUnavailableError("Network error"))
+
+    def test_opens_after_threshold_unavailable_errors(self, clock):
+        breaker = _CircuitBreaker(threshold=3, recovery_timeout=30.0)
+        for _ in range(2):
+            breaker.record(NautexAPIUnavailableError("Server error 503", status_code=503))
+        breaker.check()
+
+        breaker.record(NautexAPIUnavailableError("Server error 503", status_code=503))
+        with pytest.raises(NautexAPIError):
+            breaker.check()
+
+    def test_local_and_client_errors_do_not_open(self, clock):
+        breaker = _CircuitBreaker(threshold=3)
+        for _ in range(10):
+            breaker.record(NautexAPIError("No API token set. Call setup_token() first."))
+            breaker.record(NautexAPIError("Invalid JSON response", status_code=200))
+            breaker.record(NautexAPIError("Client error 401", status_code=401))
+        breaker.check()
+
+    def test_half_open_after_recovery_timeout(self, clock):
+        breaker = _CircuitBreaker(threshold=3, recovery_timeout=30.0)
+        self.trip(breaker)
+
+        clock[0] += 31.0
+        breaker.check()  # half-open: the probe call is let through
+
+        # A single failure while half-open re-opens the breaker
+        breaker.record(NautexAPIUnavailableError("Network error"))
+        with pytest.raises(NautexAPIError):
+            breaker.check()
+
+    def test_success_while_half_open_resets(self, clock):
+        breaker = _CircuitBreaker(threshold=3, recovery_timeout=30.0)
+        self.trip(breaker)
+
+        clock[0] += 31.0
+        breaker.check()
+        breaker.record(None)
+
+        # Back to a full threshold before it opens again
+        for _ in range(2):
+            breaker.record(NautexAPIUnavailableError("Network error"))
+        breaker.check()
+
+
+class TestServiceBreaker:
+
+    @pytest.mark.asyncio
+    async def test_missing_token_errors_do_not_block_later_calls(self):
+        client = FakeClient()
+        client.error = NautexAPIError("No API token set. Call setup_token() first.")
+        service = make_service(client)
+
+        for _ in range(10):
+            with pytest.raises(NautexAPIError):
+                await service.list_projects()
+
+        client.error = None
+        client.projects = [Project(project_id="p1", name="Project")]
+        projects = await service.list_projects()
+
+        assert [p.project_id for p in projects] == ["p1"]
+
+    @pytest.mark.asyncio
+    async def test_unavailable_errors_open_the_breaker(self):
+        client = FakeClient()
+        client.error = NautexAPIUnavailableError("Network error after 3 attempts")
+        service = make_service(client)
+
+        for _ in range(service._breaker.threshold):
+            with pytest.raises(NautexAPIUnavailableError):
+                await service.list_projects()
+
+        client.error = None
+        calls = len(client.calls)
+        with pytest.raises(NautexAPIError):
+            await service.list_projects()
+        assert len(client.calls) == calls
+
+    @pytest.mark.asyncio
+    async def test_account_info_goes_through_the_breaker(self):
+        client = FakeClient()
+        client.error = NautexAPIUnavailableError("Network error after 3 attempts")
+        service = make_service(client)
+
+        for _ in range(service._breaker.threshold):
+            assert await service.get_account_info(raise_exception=False) is None
+
+        calls = len(client.calls)
+        with pytest.raises(NautexAPIError):
+            await service.get_account_info()
+        assert len(client.calls) == calls
+
+
+class TestNetworkConnectivity:
+
+    @pytest.mark.asyncio
+    async def test_client_error_means_reachable(self):
+        client = FakeClient()
+        client.error = NautexAPIError("Client error 401", status_code=401)
+        service = make_service(client)
+
+        connected, _, error = await service.check_network_connectivity()
+
+        assert connected and error is None
+
+    @pytest.mark.asyncio
+    async def test_timeout_is_classified_by_its_cause(self):
+        client = FakeClient()
+        error = NautexAPIUnavailableError("Request timed out")
+        error.__cause__ = asyncio.TimeoutError()
+        client.error = error
+        service = make_service(client)
+
+        connected, _, message = await service.check_network_connectivity()
+
+        assert not connected
+        assert message == "Connection timeout"
+
+    @pytest.mark.asyncio
+    async def test_unclassified_cause_keeps_the_api_message(self):
+        client = FakeClient()
+        client.error = NautexAPIUnavailableError("Server error 503", status_code=503)
+        service = make_service(client)
+
+        connected, _, message = await service.check_network_connectivity()
+
+        assert not connected
+        assert message == "API error: Server error 503"